@@ -14,6 +14,7 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from services.camel_final import camel_processor
+from services.fastjson import loads as json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -159,11 +160,11 @@ async def enhanced_search(
                     
                     try:
                         if row[4]:  # camel_lemmas
-                            camel_lemmas = json.loads(row[4])
+                            camel_lemmas = json_loads(row[4])
                         if row[5]:  # camel_roots
-                            camel_roots = json.loads(row[5])
+                            camel_roots = json_loads(row[5])
                         if row[6]:  # camel_pos
-                            camel_pos = json.loads(row[6])
+                            camel_pos = json_loads(row[6])
                     except json.JSONDecodeError:
                         pass
                     
@@ -215,19 +216,24 @@ async def lemmatize_text(text: str):
     
     try:
         words = text.split()
-        results = []
         
-        for word in words:
-            lemmas = camel_processor.get_all_lemmas(word)
-            best_lemma = lemmas[0] if lemmas else word
-            
-            results.append({
+        # Analyze each distinct word once, with the processor methods bound
+        # outside the loop; repeated words reuse the same result
+        get_all_lemmas = camel_processor.get_all_lemmas
+        get_best_root = camel_processor.get_best_root
+        get_best_pos = camel_processor.get_best_pos
+        analyzed = {}
+        for word in dict.fromkeys(words):
+            lemmas = get_all_lemmas(word)
+            analyzed[word] = {
                 "word": word,
-                "lemma": best_lemma,
+                "lemma": lemmas[0] if lemmas else word,
                 "all_lemmas": lemmas[:5],  # Limit to top 5
-                "root": camel_processor.get_best_root(word),
-                "pos": camel_processor.get_best_pos(word)
-            })
+                "root": get_best_root(word),
+                "pos": get_best_pos(word)
+            }
+        
+        results = [analyzed[word] for word in words]
         
         return {
             "original_text": text,
@@ -286,11 +292,11 @@ async def search_by_root(
             
             try:
                 if row[4]:  # camel_lemmas
-                    camel_lemmas = json.loads(row[4])
+                    camel_lemmas = json_loads(row[4])
                 if row[5]:  # camel_roots  
-                    camel_roots = json.loads(row[5])
+                    camel_roots = json_loads(row[5])
                 if row[6]:  # camel_pos
-                    camel_pos = json.loads(row[6])
+                    camel_pos = json_loads(row[6])
             except json.JSONDecodeError:
                 pass
             
@@ -330,37 +336,36 @@ async def get_enhancement_stats():
         conn = sqlite3.connect('app/arabic_dict.db')
         cursor = conn.cursor()
         
-        # Total entries
-        cursor.execute("SELECT COUNT(*) FROM entries")
-        total = cursor.fetchone()[0]
-        
         # Check if CAMeL columns exist
         cursor.execute("PRAGMA table_info(entries)")
         columns = [col[1] for col in cursor.fetchall()]
         has_camel = "camel_analyzed" in columns
         
         if not has_camel:
+            cursor.execute("SELECT COUNT(*) FROM entries")
+            total = cursor.fetchone()[0]
+            conn.close()
             return {
                 "total_entries": total,
                 "camel_enhanced": False,
                 "message": "Dictionary not yet enhanced with CAMeL Tools"
             }
         
-        # Enhanced entries
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE camel_analyzed = 1")
-        enhanced = cursor.fetchone()[0]
-        
-        # Entries with roots
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE camel_roots IS NOT NULL AND camel_roots != '[]'")
-        with_roots = cursor.fetchone()[0]
-        
-        # Entries with lemmas
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE camel_lemmas IS NOT NULL AND camel_lemmas != '[]'")
-        with_lemmas = cursor.fetchone()[0]
-        
-        # Average confidence
-        cursor.execute("SELECT AVG(camel_confidence) FROM entries WHERE camel_confidence IS NOT NULL")
-        avg_confidence = cursor.fetchone()[0] or 0
+        # Totals, enhanced/root/lemma coverage and average confidence in one scan
+        cursor.execute("""
+            SELECT
+                COUNT(*),
+                SUM(CASE WHEN camel_analyzed = 1 THEN 1 ELSE 0 END),
+                SUM(CASE WHEN camel_roots IS NOT NULL AND camel_roots != '[]' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN camel_lemmas IS NOT NULL AND camel_lemmas != '[]' THEN 1 ELSE 0 END),
+                AVG(camel_confidence)
+            FROM entries
+        """)
+        total, enhanced, with_roots, with_lemmas, avg_confidence = cursor.fetchone()
+        enhanced = enhanced or 0
+        with_roots = with_roots or 0
+        with_lemmas = with_lemmas or 0
+        avg_confidence = avg_confidence or 0
         
         conn.close()
         
@@ -8,10 +8,19 @@ even without processing all remaining entries upfront. Uses on-demand CAMeL anal
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Dict, Any, Optional
 import sqlite3
-import json
 import os
+import sys
 import asyncio
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+
+# Add parent directory to path so services resolve to the same modules main.py uses
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from services.db import get_connection
+from services.fastjson import loads as json_loads, loads_cached, loads_list as json_loads_list
 
 # Try to import CAMeL Tools
 try:
@@ -20,22 +29,30 @@ try:
     from camel_tools.utils.normalize import normalize_alef_maksura_ar
     from camel_tools.utils.normalize import normalize_alef_ar
     from camel_tools.utils.normalize import normalize_teh_marbuta_ar
-    
-    # Initialize CAMeL Tools
-    camel_db = MorphologyDB.builtin_db()
-    camel_analyzer = Analyzer(camel_db)
     CAMEL_AVAILABLE = True
     
 except ImportError:
     CAMEL_AVAILABLE = False
-    camel_analyzer = None
 
 router = APIRouter(prefix="/dialect", tags=["Dialect Support"])
 
+# Features collected from each CAMeL analysis, extracted in one C-level call
+LIVE_FEATURE_KEYS = ('lex', 'root', 'pos')
+live_features = itemgetter(*LIVE_FEATURE_KEYS)
+
 def get_db_connection() -> sqlite3.Connection:
-    """Get database connection."""
-    db_path = os.path.join(os.path.dirname(__file__), "..", "arabic_dict.db")
-    return sqlite3.connect(db_path)
+    """Get the shared database connection (do not close it)."""
+    db_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "arabic_dict.db"))
+    return get_connection(db_path)
+
+@lru_cache(maxsize=1)
+def get_camel_analyzer() -> "Analyzer":
+    """Return the shared CAMeL analyzer, loading the morphology DB on first use.
+
+    Loading is deferred so importing the router stays cheap; the database is
+    read once per process and reused by every request.
+    """
+    return Analyzer(MorphologyDB.builtin_db())
 
 def normalize_arabic_text(text: str) -> str:
     """Normalize Arabic text for analysis."""
@@ -47,8 +64,59 @@ def normalize_arabic_text(text: str) -> str:
     normalized = normalize_teh_marbuta_ar(normalized)
     return normalized
 
+@lru_cache(maxsize=10000)
+def _analyze_word_cached(word: str) -> Dict[str, Any]:
+    """Run CAMeL analysis on a word, memoizing successful results only.
+
+    Failures raise instead of returning, so lru_cache never stores them and
+    the next request for the word retries.
+    """
+    normalized_word = normalize_arabic_text(word.strip())
+    analyses = get_camel_analyzer().analyze(normalized_word)
+    
+    if not analyses:
+        return {
+            'lemmas': [],
+            'roots': [],
+            'pos_tags': [],
+            'confidence': 0.0,
+            'analyses': [],
+            'live_analysis': True
+        }
+    
+    lemmas = []
+    roots = []
+    pos_tags = []
+    
+    for analysis in analyses:
+        try:
+            lex, root, pos = live_features(analysis)
+        except KeyError:
+            # Partial analysis: only collect the features it carries
+            lex, root, pos = (analysis.get(key) for key in LIVE_FEATURE_KEYS)
+        if lex is not None and lex not in lemmas:
+            lemmas.append(lex)
+        if root is not None and root not in roots:
+            roots.append(root)
+        if pos is not None and pos not in pos_tags:
+            pos_tags.append(pos)
+    
+    confidence = min(1.0, len(analyses) / 3.0) if analyses else 0.0
+    
+    return {
+        'lemmas': lemmas,
+        'roots': roots,
+        'pos_tags': pos_tags,
+        'confidence': confidence,
+        'analyses': analyses[:3],  # Top 3 analyses
+        'live_analysis': True
+    }
+
 def analyze_word_live(word: str) -> Dict[str, Any]:
-    """Perform live CAMeL analysis on a word."""
+    """Perform live CAMeL analysis on a word.
+
+    Results are memoized per word; callers must treat them as read-only.
+    """
     if not CAMEL_AVAILABLE:
         return {
             'lemmas': [],
@@ -60,42 +128,7 @@ def analyze_word_live(word: str) -> Dict[str, Any]:
         }
     
     try:
-        normalized_word = normalize_arabic_text(word.strip())
-        analyses = camel_analyzer.analyze(normalized_word)
-        
-        if not analyses:
-            return {
-                'lemmas': [],
-                'roots': [],
-                'pos_tags': [],
-                'confidence': 0.0,
-                'analyses': [],
-                'live_analysis': True
-            }
-        
-        lemmas = []
-        roots = []
-        pos_tags = []
-        
-        for analysis in analyses:
-            if 'lex' in analysis and analysis['lex'] not in lemmas:
-                lemmas.append(analysis['lex'])
-            if 'root' in analysis and analysis['root'] not in roots:
-                roots.append(analysis['root'])
-            if 'pos' in analysis and analysis['pos'] not in pos_tags:
-                pos_tags.append(analysis['pos'])
-        
-        confidence = min(1.0, len(analyses) / 3.0) if analyses else 0.0
-        
-        return {
-            'lemmas': lemmas,
-            'roots': roots,
-            'pos_tags': pos_tags,
-            'confidence': confidence,
-            'analyses': analyses[:3],  # Top 3 analyses
-            'live_analysis': True
-        }
-        
+        return _analyze_word_cached(word)
     except Exception as e:
         return {
             'lemmas': [],
@@ -130,8 +163,8 @@ async def analyze_word_dialect(word: str) -> Dict[str, Any]:
         word.replace('ه', 'ة'),  # ه -> ة
     ]
     
-    # Remove duplicates
-    word_variations = list(set(word_variations))
+    # Remove duplicates, keeping the exact spelling first so it is tried first
+    word_variations = list(dict.fromkeys(word_variations))
     
     # Try to find word in database with variations
     stored_result = None
@@ -165,9 +198,9 @@ async def analyze_word_dialect(word: str) -> Dict[str, Any]:
     if stored_result:
         lemma, lemma_norm, root, pos, camel_lemmas, camel_roots, camel_pos_tags, camel_confidence, buckwalter, phonetic, register = stored_result
         
-        stored_lemmas = json.loads(camel_lemmas) if camel_lemmas else []
-        stored_roots = json.loads(camel_roots) if camel_roots else []
-        stored_pos = json.loads(camel_pos_tags) if camel_pos_tags else []
+        stored_lemmas = json_loads_list(camel_lemmas)
+        stored_roots = json_loads_list(camel_roots)
+        stored_pos = json_loads_list(camel_pos_tags)
         
         result['analysis'] = {
             'lemma': lemma,
@@ -179,7 +212,7 @@ async def analyze_word_dialect(word: str) -> Dict[str, Any]:
             'pos_tags': stored_pos if stored_pos else ([pos] if pos and pos != 'unknown' else []),
             'confidence': camel_confidence or 0.7,
             'buckwalter': buckwalter,
-            'phonetic_data': json.loads(phonetic) if phonetic else {},
+            'phonetic_data': json_loads(phonetic) if phonetic else {},
             'live_analysis': False
         }
         
@@ -220,7 +253,6 @@ async def analyze_word_dialect(word: str) -> Dict[str, Any]:
                 'note': 'Install CAMeL Tools for live morphological analysis'
             }
     
-    conn.close()
     return result
     
     return result
@@ -259,14 +291,16 @@ async def search_by_root_enhanced(
     }
     
     # Process stored results
+    # Rows sharing this root repeat the same camel_roots text; parse each blob once
     for lemma, stored_root, camel_roots, camel_lemmas, pos in stored_results:
+        parsed_roots = loads_cached(camel_roots) if camel_roots else []
         entry_data = {
             'lemma': lemma,
             'stored_root': stored_root,
-            'camel_roots': json.loads(camel_roots) if camel_roots else [],
-            'camel_lemmas': json.loads(camel_lemmas) if camel_lemmas else [],
+            'camel_roots': parsed_roots,
+            'camel_lemmas': json_loads_list(camel_lemmas),
             'pos': pos,
-            'matches_root': stored_root == root or root in (json.loads(camel_roots) if camel_roots else [])
+            'matches_root': stored_root == root or root in parsed_roots
         }
         
         # Add live analysis if requested
@@ -278,19 +312,15 @@ async def search_by_root_enhanced(
         results['entries'].append(entry_data)
     
     # Add root statistics
-    all_pos = [entry['pos'] for entry in results['entries'] if entry['pos']]
-    pos_distribution = {}
-    for pos in all_pos:
-        pos_distribution[pos] = pos_distribution.get(pos, 0) + 1
+    pos_distribution = Counter(entry['pos'] for entry in results['entries'] if entry['pos'])
     
     results['root_statistics'] = {
         'total_matches': len(results['entries']),
-        'pos_distribution': pos_distribution,
-        'most_common_pos': max(pos_distribution.items(), key=lambda x: x[1])[0] if pos_distribution else None,
+        'pos_distribution': dict(pos_distribution),
+        'most_common_pos': pos_distribution.most_common(1)[0][0] if pos_distribution else None,
         'morphological_diversity': len(pos_distribution)
     }
     
-    conn.close()
     return results
 
 @router.get("/variants/{word}")
@@ -317,9 +347,9 @@ async def get_dialect_variants(word: str) -> Dict[str, Any]:
     if 'camel_roots' in analysis_data:
         all_roots.extend(analysis_data['camel_roots'])
     
-    # Remove duplicates
-    all_lemmas = list(set(all_lemmas))
-    all_roots = list(set(all_roots))
+    # Remove duplicates (stored forms first, then live CAMeL forms)
+    all_lemmas = list(dict.fromkeys(all_lemmas))
+    all_roots = list(dict.fromkeys(all_roots))
     
     variants = {
         'query_word': word,
@@ -383,7 +413,6 @@ async def get_dialect_variants(word: str) -> Dict[str, Any]:
         'morphological_richness_score': len(all_roots) * 2 + len(all_lemmas)
     }
     
-    conn.close()
     return variants
 
 @router.get("/coverage/stats")
@@ -392,15 +421,19 @@ async def get_dialect_coverage_stats() -> Dict[str, Any]:
     conn = get_db_connection()
     cursor = conn.cursor()
     
-    # Basic counts
-    cursor.execute("SELECT COUNT(*) FROM entries")
-    total_entries = cursor.fetchone()[0]
-    
+    # Basic counts and root coverage in a single scan
     cursor.execute("""
-        SELECT COUNT(*) FROM entries 
-        WHERE camel_lemmas IS NOT NULL AND camel_lemmas != '' AND camel_lemmas != '[]'
+        SELECT
+            COUNT(*),
+            SUM(CASE WHEN camel_lemmas IS NOT NULL AND camel_lemmas != '' AND camel_lemmas != '[]'
+                     THEN 1 ELSE 0 END),
+            COUNT(DISTINCT CASE WHEN camel_roots != '' AND camel_roots != '[]'
+                                THEN camel_roots END),
+            COUNT(DISTINCT root)
+        FROM entries
     """)
-    stored_analysis = cursor.fetchone()[0]
+    total_entries, stored_analysis, unique_camel_roots, unique_traditional_roots = cursor.fetchone()
+    stored_analysis = stored_analysis or 0
     
     # POS distribution in analyzed entries
     cursor.execute("""
@@ -413,19 +446,6 @@ async def get_dialect_coverage_stats() -> Dict[str, Any]:
     """)
     pos_distribution = cursor.fetchall()
     
-    # Root coverage
-    cursor.execute("""
-        SELECT COUNT(DISTINCT camel_roots) 
-        FROM entries 
-        WHERE camel_roots IS NOT NULL AND camel_roots != '' AND camel_roots != '[]'
-    """)
-    unique_camel_roots = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(DISTINCT root) FROM entries WHERE root IS NOT NULL")
-    unique_traditional_roots = cursor.fetchone()[0]
-    
-    conn.close()
-    
     return {
         'total_entries': total_entries,
         'stored_camel_analysis': stored_analysis,
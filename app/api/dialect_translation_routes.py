@@ -5,8 +5,13 @@ Ammiya (Colloquial) <-> Fusha (MSA) translation with synonyms
 
 from fastapi import APIRouter, HTTPException, Query
 from typing import Dict, List, Any
-from ..services.dialect_mapper import ArabicDialectMapper
 import os
+import sys
+
+# Add parent directory to path so services resolve to the same modules main.py uses
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from services.dialect_mapper import ArabicDialectMapper
 
 router = APIRouter(prefix="/dialect/translate", tags=["Dialect Translation"])
 
@@ -270,7 +275,7 @@ def _get_spelling_suggestions(word: str) -> List[str]:
     if 'ي' in word:
         suggestions.append(word.replace('ي', 'ى'))
         
-    return list(set(suggestions))[:3]
+    return list(dict.fromkeys(suggestions))[:3]
 
 def _get_msa_suggestions(word: str) -> List[str]:
     """Get MSA word suggestions."""
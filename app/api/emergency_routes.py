@@ -6,92 +6,134 @@ This bypasses all caching and creates a fresh comprehensive database.
 from fastapi import APIRouter, HTTPException
 import sqlite3
 import os
+import sys
 import time
+from itertools import count, islice
 from typing import Dict, Any
 
+# Add parent directory to path so services resolve to the same modules main.py uses
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from services.db import INDEXES
+
 router = APIRouter()
 
+# Columns inserted per emergency entry row
+ENTRY_COLUMNS = 18
+
+# Rows per multi-row INSERT, kept under SQLite's 999 bound-parameter default
+INSERT_BATCH_ROWS = 999 // ENTRY_COLUMNS
+
+# Sample tuples carry (lemma, lemma_norm, root, pos, subpos, register, domain, freq_rank)
+SAMPLE_COLUMNS = 8
+
+# CAMeL and phase-2 columns, identical for every emergency row
+EMERGENCY_ROW_TAIL = ("", "", "", None, None, None, None, 0, 0)
+
+def entry_row(row_id: int, entry: tuple) -> tuple:
+    """Build the full entries row for one sample tuple, padding missing fields with None."""
+    sample = tuple(entry[:SAMPLE_COLUMNS])
+    if len(sample) < SAMPLE_COLUMNS:
+        sample += (None,) * (SAMPLE_COLUMNS - len(sample))
+    return (row_id, *sample, *EMERGENCY_ROW_TAIL)
+
+def values_clause(row_count: int) -> str:
+    """Build a VALUES clause with placeholders for row_count entry rows."""
+    row = "(" + ", ".join("?" * ENTRY_COLUMNS) + ")"
+    return ", ".join([row] * row_count)
+
 @router.get("/emergency/deploy-real-db")
 async def emergency_deploy_real_database() -> Dict[str, Any]:
     """Emergency endpoint to deploy real comprehensive database."""
     try:
         # Import our real comprehensive data
-        import sys
         sys.path.append('/app')
-        from real_db_sample import REAL_ENTRIES
+        from real_db_sample import iter_real_entries
         
         # Create unique database with timestamp to avoid caching
         timestamp = str(int(time.time()))
         emergency_db_path = f"/app/emergency_comprehensive_{timestamp}.db"
         
-        # Create database
-        conn = sqlite3.connect(emergency_db_path)
+        # Create database (autocommit mode; the bulk insert manages its own transaction)
+        conn = sqlite3.connect(emergency_db_path, isolation_level=None)
         cursor = conn.cursor()
         
-        # Create schema
-        cursor.execute("""
-        CREATE TABLE entries (
-            id INTEGER PRIMARY KEY,
-            lemma TEXT NOT NULL,
-            lemma_norm TEXT,
-            root TEXT,
-            pos TEXT,
-            subpos TEXT,
-            register TEXT,
-            domain TEXT,
-            freq_rank INTEGER,
-            camel_lemmas TEXT,
-            camel_roots TEXT,
-            camel_pos_tags TEXT,
-            camel_confidence REAL,
-            buckwalter_transliteration TEXT,
-            phonetic_transcription TEXT,
-            semantic_features TEXT,
-            phase2_enhanced INTEGER DEFAULT 0,
-            camel_analyzed INTEGER DEFAULT 0
-        )
+        # The file is rebuilt from source on every deploy, so trade durability for load speed;
+        # PRAGMAs and schema go to SQLite as one script
+        cursor.executescript("""
+            PRAGMA journal_mode=MEMORY;
+            PRAGMA synchronous=OFF;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA locking_mode=EXCLUSIVE;
+            
+            CREATE TABLE entries (
+                id INTEGER PRIMARY KEY,
+                lemma TEXT NOT NULL,
+                lemma_norm TEXT,
+                root TEXT,
+                pos TEXT,
+                subpos TEXT,
+                register TEXT,
+                domain TEXT,
+                freq_rank INTEGER,
+                camel_lemmas TEXT,
+                camel_roots TEXT,
+                camel_pos_tags TEXT,
+                camel_confidence REAL,
+                buckwalter_transliteration TEXT,
+                phonetic_transcription TEXT,
+                semantic_features TEXT,
+                phase2_enhanced INTEGER DEFAULT 0,
+                camel_analyzed INTEGER DEFAULT 0
+            );
         """)
         
-        # Insert real comprehensive data
-        for i, entry in enumerate(REAL_ENTRIES):
-            # entry is a tuple: (lemma, lemma_norm, root, pos, subpos, register, domain, freq_rank)
-            cursor.execute("""
-            INSERT INTO entries (
-                id, lemma, lemma_norm, root, pos, subpos, register, domain,
-                freq_rank, camel_lemmas, camel_roots, camel_pos_tags,
-                camel_confidence, buckwalter_transliteration, 
-                phonetic_transcription, semantic_features,
-                phase2_enhanced, camel_analyzed
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                i + 1,                  # id
-                entry[0],              # lemma
-                entry[1] if len(entry) > 1 else None,  # lemma_norm
-                entry[2] if len(entry) > 2 else None,  # root
-                entry[3] if len(entry) > 3 else None,  # pos
-                entry[4] if len(entry) > 4 else None,  # subpos
-                entry[5] if len(entry) > 5 else None,  # register
-                entry[6] if len(entry) > 6 else None,  # domain
-                entry[7] if len(entry) > 7 else None,  # freq_rank
-                "",                     # camel_lemmas
-                "",                     # camel_roots
-                "",                     # camel_pos_tags
-                None,                   # camel_confidence
-                None,                   # buckwalter_transliteration
-                None,                   # phonetic_transcription
-                None,                   # semantic_features
-                0,                      # phase2_enhanced
-                0                       # camel_analyzed
-            ))
-        
-        conn.commit()
+        # Insert real comprehensive data in one transaction
+        rows = map(entry_row, count(1), iter_real_entries())
+        
+        insert_sql = """
+        INSERT INTO entries (
+            id, lemma, lemma_norm, root, pos, subpos, register, domain,
+            freq_rank, camel_lemmas, camel_roots, camel_pos_tags,
+            camel_confidence, buckwalter_transliteration, 
+            phonetic_transcription, semantic_features,
+            phase2_enhanced, camel_analyzed
+        ) VALUES """
+        full_batch_sql = insert_sql + values_clause(INSERT_BATCH_ROWS)
+        
+        # Multi-row INSERTs: one statement dispatch per batch instead of per row
+        cursor.execute("BEGIN")
+        while True:
+            batch = list(islice(rows, INSERT_BATCH_ROWS))
+            if not batch:
+                break
+            sql = full_batch_sql if len(batch) == INSERT_BATCH_ROWS else insert_sql + values_clause(len(batch))
+            cursor.execute(sql, [value for row in batch for value in row])
+        cursor.execute("COMMIT")
+        
+        # Build lookup indexes once over the loaded rows instead of per insert,
+        # then serve the finished database with WAL and normal locking
+        # (the same INDEXES the deploy scripts build, so serving never has to)
+        cursor.executescript(";\n".join(INDEXES) + """;
+            ANALYZE;
+            PRAGMA locking_mode=NORMAL;
+            PRAGMA journal_mode=WAL;
+        """)
         
         # Get database stats
         cursor.execute("SELECT COUNT(*) FROM entries")
         total_count = cursor.fetchone()[0]
         
-        # Test for complex words
-        cursor.execute("SELECT lemma FROM entries WHERE lemma LIKE '%استقلال%' OR lemma LIKE '%محاضرة%' OR lemma LIKE '%اقتصاد%'")
+        # Test for complex words: indexed equality probes by default, the
+        # full-table substring scan only when VERIFY_DB is set
+        if os.environ.get("VERIFY_DB"):
+            cursor.execute("SELECT lemma FROM entries WHERE lemma LIKE '%استقلال%' OR lemma LIKE '%محاضرة%' OR lemma LIKE '%اقتصاد%'")
+        else:
+            cursor.execute(
+                "SELECT lemma FROM entries WHERE lemma_norm IN (?, ?, ?)",
+                ("استقلال", "محاضره", "اقتصاد"),
+            )
         complex_words = [row[0] for row in cursor.fetchall()]
         
         # Get sample of entries
@@ -5,14 +5,34 @@ Replaces the in-memory JSON approach with database integration.
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional, Dict, Any
 import sqlite3
-import json
-from ..services.normalize import normalize_ar
+import os
+import sys
+
+# Add parent directory to path so services resolve to the same modules main.py uses
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from services.normalize import normalize_ar
+from services.db import get_connection
+from services.fastjson import loads as json_loads, loads_list as json_loads_list
 
 router = APIRouter()
 
 def get_db_connection():
-    """Get database connection."""
-    return sqlite3.connect("app/arabic_dict.db")
+    """Get the shared database connection (do not close it)."""
+    return get_connection("app/arabic_dict.db")
+
+# Enhanced search with all enhanced features; built once so every request
+# passes the same string to SQLite's statement cache
+ENHANCED_SEARCH_SQL = """
+    SELECT 
+        lemma, root, pos, 
+        buckwalter_transliteration, phonetic_transcription, semantic_features,
+        camel_roots, camel_lemmas, camel_pos_tags,
+        phase2_enhanced, camel_analyzed
+    FROM entries 
+    WHERE lemma LIKE ? OR lemma_norm LIKE ?
+    LIMIT ?
+"""
 
 @router.get("/search/enhanced")
 async def enhanced_search(
@@ -29,35 +49,24 @@ async def enhanced_search(
     conn = get_db_connection()
     cursor = conn.cursor()
     
-    # Build query with all enhanced features
-    base_query = """
-        SELECT 
-            lemma, root, pos, 
-            buckwalter_transliteration, phonetic_transcription, semantic_features,
-            camel_roots, camel_lemmas, camel_pos_tags,
-            phase2_enhanced, camel_analyzed
-        FROM entries 
-        WHERE lemma LIKE ? OR lemma_norm LIKE ?
-    """
-    
     search_term = f"%{q}%"
-    cursor.execute(f"{base_query} LIMIT ?", (search_term, search_term, limit))
+    cursor.execute(ENHANCED_SEARCH_SQL, (search_term, search_term, limit))
     
     results = []
-    for row in cursor.fetchall():
+    for row in cursor:
         result = {
             "lemma": row[0],
             "root": row[1], 
             "pos": row[2],
             "phonetics": {
                 "buckwalter": row[3],
-                "transcription": json.loads(row[4]) if row[4] else None,
-                "semantic": json.loads(row[5]) if row[5] else None
+                "transcription": json_loads(row[4]) if row[4] else None,
+                "semantic": json_loads(row[5]) if row[5] else None
             } if include_phonetics else None,
             "camel_analysis": {
-                "roots": json.loads(row[6]) if row[6] else [],
-                "lemmas": json.loads(row[7]) if row[7] else [], 
-                "pos_tags": json.loads(row[8]) if row[8] else []
+                "roots": json_loads_list(row[6]),
+                "lemmas": json_loads_list(row[7]), 
+                "pos_tags": json_loads_list(row[8])
             } if include_camel else None,
             "enhanced": {
                 "phase2": bool(row[9]),
@@ -66,8 +75,6 @@ async def enhanced_search(
         }
         results.append(result)
     
-    conn.close()
-    
     return {
         "query": q,
         "results": results,
@@ -92,13 +99,12 @@ async def get_phonetics(word: str):
     """, (word,))
     
     row = cursor.fetchone()
-    conn.close()
     
     if not row:
         raise HTTPException(status_code=404, detail=f"No phonetic data found for '{word}'")
     
-    phonetic_data = json.loads(row[2]) if row[2] else {}
-    semantic_data = json.loads(row[3]) if row[3] else {}
+    phonetic_data = json_loads(row[2]) if row[2] else {}
+    semantic_data = json_loads(row[3]) if row[3] else {}
     
     return {
         "word": word,
@@ -113,6 +119,25 @@ async def get_phonetics(word: str):
         "available_scripts": ["arabic", "buckwalter", "ipa", "latin"]
     }
 
+# Coverage counters reported by /stats/comprehensive, keyed by stats field
+COVERAGE_CONDITIONS = {
+    "phase2_enhanced": "phase2_enhanced = 1",
+    "camel_enhanced": "camel_analyzed = 1",
+    "buckwalter_coverage": "buckwalter_transliteration IS NOT NULL",
+    "phonetic_coverage": "phonetic_transcription IS NOT NULL",
+}
+
+COMPREHENSIVE_STATS_SQL = """
+    SELECT 
+        COUNT(*) AS total_entries,
+        {},
+        COUNT(DISTINCT camel_roots) AS unique_roots
+    FROM entries
+""".format(",\n        ".join(
+    f"SUM(CASE WHEN {condition} THEN 1 ELSE 0 END) AS {field}"
+    for field, condition in COVERAGE_CONDITIONS.items()
+))
+
 @router.get("/stats/comprehensive")
 async def comprehensive_stats():
     """Get comprehensive statistics about the enhanced database."""
@@ -123,27 +148,12 @@ async def comprehensive_stats():
     # Get various statistics
     stats = {}
     
-    # Total entries
-    cursor.execute("SELECT COUNT(*) FROM entries")
-    stats["total_entries"] = cursor.fetchone()[0]
-    
-    # Enhanced entries
-    cursor.execute("SELECT COUNT(*) FROM entries WHERE phase2_enhanced = 1")
-    stats["phase2_enhanced"] = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM entries WHERE camel_analyzed = 1")
-    stats["camel_enhanced"] = cursor.fetchone()[0]
-    
-    # Phonetic coverage
-    cursor.execute("SELECT COUNT(*) FROM entries WHERE buckwalter_transliteration IS NOT NULL")
-    stats["buckwalter_coverage"] = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM entries WHERE phonetic_transcription IS NOT NULL")
-    stats["phonetic_coverage"] = cursor.fetchone()[0]
-    
-    # Root analysis
-    cursor.execute("SELECT COUNT(DISTINCT camel_roots) FROM entries WHERE camel_roots IS NOT NULL")
-    stats["unique_roots"] = cursor.fetchone()[0]
+    # Total entries, coverage counts and unique roots in a single scan
+    cursor.execute(COMPREHENSIVE_STATS_SQL)
+    row = cursor.fetchone()
+    stats.update(zip([column[0] for column in cursor.description], row))
+    for field in COVERAGE_CONDITIONS:
+        stats[field] = stats[field] or 0
     
     # POS distribution
     cursor.execute("""
@@ -156,8 +166,6 @@ async def comprehensive_stats():
     """)
     stats["pos_distribution"] = dict(cursor.fetchall())
     
-    conn.close()
-    
     return {
         "database_stats": stats,
         "enhancement_rates": {
@@ -11,8 +11,17 @@ from fastapi import APIRouter, HTTPException, Query
 from typing import List, Dict, Any, Optional
 import sqlite3
 import json
+import os
+import sys
+from functools import lru_cache
 from pydantic import BaseModel
 
+# Add parent directory to path so services resolve to the same modules main.py uses
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from services.db import SCREEN1_TABLE, SCREEN1_VIEW, get_connection, screen1_snapshot_is_current
+from services.fastjson import loads as json_loads
+
 # Response Models
 class InfoResponse(BaseModel):
     lemma: str
@@ -58,10 +67,25 @@ class MorphologyResponse(BaseModel):
 router = APIRouter()
 
 def get_db_connection():
-    """Get database connection"""
-    import os
-    db_path = os.path.join(os.path.dirname(__file__), "../arabic_dict.db")
-    return sqlite3.connect(db_path)
+    """Get the shared database connection (do not close it)"""
+    db_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "../arabic_dict.db"))
+    return get_connection(db_path)
+
+# Table the info screen reads from; resolved once per process
+_screen1_source: Optional[str] = None
+
+def get_screen1_source(conn: sqlite3.Connection) -> str:
+    """Pick the materialized screen-1 snapshot if it is current, else the view.
+
+    The view re-evaluates its CASE projections on every lookup, so the
+    deploy scripts materialize it into a lemma-indexed table stamped with
+    the state of entries. Serving never writes: a missing or stale snapshot
+    (replaced database, changed entries) falls back to the view.
+    """
+    global _screen1_source
+    if _screen1_source is None:
+        _screen1_source = SCREEN1_TABLE if screen1_snapshot_is_current(conn) else SCREEN1_VIEW
+    return _screen1_source
 
 @router.get("/word/{lemma}/info", response_model=InfoResponse)
 async def get_word_info(lemma: str):
@@ -69,15 +93,14 @@ async def get_word_info(lemma: str):
     conn = get_db_connection()
     cursor = conn.cursor()
     
-    cursor.execute('''
+    cursor.execute(f'''
         SELECT lemma, enhanced_root, pos, enhanced_pattern, enhanced_register
-        FROM enhanced_screen1_view 
+        FROM {get_screen1_source(conn)}
         WHERE lemma = ?
         LIMIT 1
     ''', (lemma,))
     
     result = cursor.fetchone()
-    conn.close()
     
     if not result:
         raise HTTPException(status_code=404, detail="Word not found")
@@ -92,55 +115,75 @@ async def get_word_info(lemma: str):
         register=register if register != "standard" else None
     )
 
-@router.get("/word/{lemma}/senses", response_model=List[SenseResponse])
-async def get_word_senses(lemma: str):
-    """Screen 2: Word meanings and definitions"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT semantic_features, camel_english_glosses, pos
+# Columns each screen reads from entries; /complete fetches their union once
+SENSES_COLUMNS = ("semantic_features", "camel_english_glosses", "pos")
+RELATIONS_COLUMNS = ("semantic_relations", "root")
+PRONUNCIATION_COLUMNS = ("phonetic_transcription", "buckwalter_transliteration")
+DIALECTS_COLUMNS = ("cross_dialect_variants", "camel_lemmas")
+MORPHOLOGY_COLUMNS = ("pos", "advanced_morphology", "camel_morphology", "pattern")
+COMPLETE_COLUMNS = tuple(dict.fromkeys(
+    SENSES_COLUMNS + RELATIONS_COLUMNS + PRONUNCIATION_COLUMNS + DIALECTS_COLUMNS + MORPHOLOGY_COLUMNS
+))
+
+@lru_cache(maxsize=None)
+def entry_query(columns: tuple) -> str:
+    """SELECT for the named entry columns, built once per column tuple"""
+    return f'''
+        SELECT {", ".join(columns)}
         FROM entries 
         WHERE lemma = ?
         LIMIT 1
-    ''', (lemma,))
+    '''
+
+def fetch_entry(conn: sqlite3.Connection, lemma: str, columns: tuple) -> sqlite3.Row:
+    """Fetch the named entry columns for a lemma, or raise 404"""
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    cursor.execute(entry_query(columns), (lemma,))
     
     result = cursor.fetchone()
-    conn.close()
     
     if not result:
         raise HTTPException(status_code=404, detail="Word not found")
     
-    semantic_features, english_glosses, pos = result
+    return result
+
+def build_senses(lemma: str, row: sqlite3.Row) -> List[SenseResponse]:
+    """Screen 2 payload from an entry row"""
+    semantic_features = row["semantic_features"]
+    english_glosses = row["camel_english_glosses"]
     
     senses = []
     
     # Parse semantic features
     if semantic_features:
         try:
-            features = json.loads(semantic_features)
+            features = json_loads(semantic_features)
+            get = features.get
             
             # Create primary sense
             primary_sense = SenseResponse(
                 sense_id=1,
-                definition_ar=features.get("meaning", f"معنى {lemma}"),
-                definition_en=features.get("english_gloss", ""),
-                domain=features.get("domain", "general"),
-                frequency=features.get("frequency", "common")
+                definition_ar=get("meaning", f"معنى {lemma}"),
+                definition_en=get("english_gloss", ""),
+                domain=get("domain", "general"),
+                frequency=get("frequency", "common")
             )
             senses.append(primary_sense)
             
             # Add domain-specific senses
-            if "domains" in features and isinstance(features["domains"], list):
-                for i, domain in enumerate(features["domains"][:2]):
-                    domain_sense = SenseResponse(
-                        sense_id=i + 2,
+            domains = get("domains")
+            if type(domains) is list:
+                senses += [
+                    SenseResponse(
+                        sense_id=i,
                         definition_ar=f"معنى في مجال {domain}",
                         definition_en=f"Meaning in {domain} context",
                         domain=domain,
                         frequency="specialized"
                     )
-                    senses.append(domain_sense)
+                    for i, domain in enumerate(domains[:2], 2)
+                ]
                     
         except json.JSONDecodeError:
             pass
@@ -148,8 +191,8 @@ async def get_word_senses(lemma: str):
     # Parse English glosses
     if english_glosses:
         try:
-            glosses = json.loads(english_glosses)
-            if isinstance(glosses, list) and len(senses) > 0:
+            glosses = json_loads(english_glosses)
+            if type(glosses) is list and senses:
                 senses[0].definition_en = glosses[0] if glosses else ""
         except:
             pass
@@ -166,26 +209,15 @@ async def get_word_senses(lemma: str):
     
     return senses
 
-@router.get("/word/{lemma}/relations", response_model=RelationResponse)
-async def get_word_relations(lemma: str):
-    """Screen 4: Synonyms, antonyms, and related words"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT semantic_relations, root
-        FROM entries 
-        WHERE lemma = ?
-        LIMIT 1
-    ''', (lemma,))
-    
-    result = cursor.fetchone()
-    conn.close()
-    
-    if not result:
-        raise HTTPException(status_code=404, detail="Word not found")
-    
-    semantic_relations, root = result
+@router.get("/word/{lemma}/senses", response_model=List[SenseResponse])
+async def get_word_senses(lemma: str):
+    """Screen 2: Word meanings and definitions"""
+    return build_senses(lemma, fetch_entry(get_db_connection(), lemma, SENSES_COLUMNS))
+
+def build_relations(lemma: str, row: sqlite3.Row) -> RelationResponse:
+    """Screen 4 payload from an entry row"""
+    semantic_relations = row["semantic_relations"]
+    root = row["root"]
     
     relations = RelationResponse(
         synonyms=[],
@@ -198,14 +230,15 @@ async def get_word_relations(lemma: str):
     # Parse semantic relations
     if semantic_relations:
         try:
-            relations_data = json.loads(semantic_relations)
+            relations_data = json_loads(semantic_relations)
             
-            if isinstance(relations_data, dict):
-                relations.synonyms = relations_data.get("synonyms", [])[:5]
-                relations.antonyms = relations_data.get("antonyms", [])[:5]
-                relations.related = relations_data.get("related", [])[:5]
-                relations.hypernyms = relations_data.get("hypernyms", [])[:3]
-                relations.hyponyms = relations_data.get("hyponyms", [])[:3]
+            if type(relations_data) is dict:
+                get = relations_data.get
+                relations.synonyms = get("synonyms", [])[:5]
+                relations.antonyms = get("antonyms", [])[:5]
+                relations.related = get("related", [])[:5]
+                relations.hypernyms = get("hypernyms", [])[:3]
+                relations.hyponyms = get("hyponyms", [])[:3]
                 
         except json.JSONDecodeError:
             pass
@@ -223,30 +256,18 @@ async def get_word_relations(lemma: str):
         
         same_root = [row[0] for row in cursor.fetchall()]
         relations.related.extend(same_root)
-        conn.close()
     
     return relations
 
-@router.get("/word/{lemma}/pronunciation", response_model=PronunciationResponse)
-async def get_word_pronunciation(lemma: str):
-    """Screen 5: Pronunciation data"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT phonetic_transcription, buckwalter_transliteration
-        FROM entries 
-        WHERE lemma = ?
-        LIMIT 1
-    ''', (lemma,))
-    
-    result = cursor.fetchone()
-    conn.close()
-    
-    if not result:
-        raise HTTPException(status_code=404, detail="Word not found")
-    
-    phonetic_transcription, buckwalter = result
+@router.get("/word/{lemma}/relations", response_model=RelationResponse)
+async def get_word_relations(lemma: str):
+    """Screen 4: Synonyms, antonyms, and related words"""
+    return build_relations(lemma, fetch_entry(get_db_connection(), lemma, RELATIONS_COLUMNS))
+
+def build_pronunciation(row: sqlite3.Row) -> PronunciationResponse:
+    """Screen 5 payload from an entry row"""
+    phonetic_transcription = row["phonetic_transcription"]
+    buckwalter = row["buckwalter_transliteration"]
     
     pronunciation = PronunciationResponse(
         buckwalter=buckwalter,
@@ -258,38 +279,31 @@ async def get_word_pronunciation(lemma: str):
     # Parse phonetic transcription
     if phonetic_transcription:
         try:
-            phonetic_data = json.loads(phonetic_transcription)
+            phonetic_data = json_loads(phonetic_transcription)
             
-            if isinstance(phonetic_data, dict):
-                pronunciation.ipa = phonetic_data.get("ipa_approx")
-                pronunciation.simplified = phonetic_data.get("simple_pronunciation")
-                pronunciation.alternatives = phonetic_data.get("alternatives", [])[:3]
+            if type(phonetic_data) is dict:
+                get = phonetic_data.get
+                pronunciation.ipa = get("ipa_approx")
+                pronunciation.simplified = get("simple_pronunciation")
+                pronunciation.alternatives = get("alternatives", [])[:3]
                 
         except json.JSONDecodeError:
             pass
     
     return pronunciation
 
-@router.get("/word/{lemma}/dialects", response_model=DialectResponse)
-async def get_word_dialects(lemma: str):
-    """Screen 6: Cross-dialect analysis"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT cross_dialect_variants, camel_lemmas
-        FROM entries 
-        WHERE lemma = ?
-        LIMIT 1
-    ''', (lemma,))
-    
-    result = cursor.fetchone()
-    conn.close()
-    
-    if not result:
-        raise HTTPException(status_code=404, detail="Word not found")
-    
-    cross_dialect_variants, camel_lemmas = result
+@router.get("/word/{lemma}/pronunciation", response_model=PronunciationResponse)
+async def get_word_pronunciation(lemma: str):
+    """Screen 5: Pronunciation data"""
+    return build_pronunciation(fetch_entry(get_db_connection(), lemma, PRONUNCIATION_COLUMNS))
+
+# Dialects CAMeL variants are spread across on screen 6, in round-robin order
+DIALECT_BUCKETS = ("egyptian", "levantine", "gulf", "maghrebi")
+
+def build_dialects(lemma: str, row: sqlite3.Row) -> DialectResponse:
+    """Screen 6 payload from an entry row"""
+    cross_dialect_variants = row["cross_dialect_variants"]
+    camel_lemmas = row["camel_lemmas"]
     
     dialects = DialectResponse(
         standard=lemma,
@@ -307,9 +321,9 @@ async def get_word_dialects(lemma: str):
     # Parse cross-dialect variants
     if cross_dialect_variants:
         try:
-            variants_data = json.loads(cross_dialect_variants)
+            variants_data = json_loads(cross_dialect_variants)
             
-            if isinstance(variants_data, dict):
+            if type(variants_data) is dict:
                 if "variants" in variants_data:
                     dialects.variants.update(variants_data["variants"])
                     
@@ -319,40 +333,36 @@ async def get_word_dialects(lemma: str):
     # Parse CAMeL analysis for additional variants
     if camel_lemmas:
         try:
-            camel_data = json.loads(camel_lemmas)
-            if isinstance(camel_data, list):
-                dialects.camel_analysis = camel_data[:8]
+            camel_data = json_loads(camel_lemmas)
+            if type(camel_data) is list:
+                top_variants = dialects.camel_analysis = camel_data[:8]
                 
-                # Distribute CAMeL variants across dialects
-                for i, variant in enumerate(camel_data[:8]):
-                    dialect_key = ["egyptian", "levantine", "gulf", "maghrebi"][i % 4]
-                    dialects.variants[dialect_key].append(variant)
+                # Distribute CAMeL variants across dialects round-robin:
+                # bucket b takes every fourth variant starting at b
+                for b, bucket in enumerate(DIALECT_BUCKETS):
+                    dialects.variants[bucket] += top_variants[b::4]
                     
         except json.JSONDecodeError:
             pass
     
     return dialects
 
-@router.get("/word/{lemma}/morphology", response_model=MorphologyResponse)
-async def get_word_morphology(lemma: str):
-    """Screen 7: Morphological analysis"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT pos, advanced_morphology, camel_morphology, pattern
-        FROM entries 
-        WHERE lemma = ?
-        LIMIT 1
-    ''', (lemma,))
-    
-    result = cursor.fetchone()
-    conn.close()
-    
-    if not result:
-        raise HTTPException(status_code=404, detail="Word not found")
-    
-    pos, advanced_morphology, camel_morphology, pattern = result
+@router.get("/word/{lemma}/dialects", response_model=DialectResponse)
+async def get_word_dialects(lemma: str):
+    """Screen 6: Cross-dialect analysis"""
+    return build_dialects(lemma, fetch_entry(get_db_connection(), lemma, DIALECTS_COLUMNS))
+
+# Affixes for the basic screen-7 inflections
+DUAL_SUFFIX = "ان"
+PLURAL_SUFFIX = "ات"
+IMPERFECT_PREFIX = "ي"
+
+def build_morphology(lemma: str, row: sqlite3.Row) -> MorphologyResponse:
+    """Screen 7 payload from an entry row"""
+    pos = row["pos"]
+    advanced_morphology = row["advanced_morphology"]
+    camel_morphology = row["camel_morphology"]
+    pattern = row["pattern"]
     
     morphology = MorphologyResponse(
         pos=pos or "unknown",
@@ -364,8 +374,8 @@ async def get_word_morphology(lemma: str):
     # Parse advanced morphology
     if advanced_morphology:
         try:
-            morph_data = json.loads(advanced_morphology)
-            if isinstance(morph_data, dict):
+            morph_data = json_loads(advanced_morphology)
+            if type(morph_data) is dict:
                 morphology.features = morph_data
                 
         except json.JSONDecodeError:
@@ -374,8 +384,8 @@ async def get_word_morphology(lemma: str):
     # Parse CAMeL morphology
     if camel_morphology:
         try:
-            camel_data = json.loads(camel_morphology)
-            if isinstance(camel_data, dict):
+            camel_data = json_loads(camel_morphology)
+            if type(camel_data) is dict:
                 morphology.features.update({"camel": camel_data})
                 
         except json.JSONDecodeError:
@@ -389,29 +399,37 @@ async def get_word_morphology(lemma: str):
     if pos == "noun":
         morphology.inflections = {
             "singular": lemma,
-            "dual": f"{lemma}ان",
-            "plural": f"{lemma}ات"
+            "dual": lemma + DUAL_SUFFIX,
+            "plural": lemma + PLURAL_SUFFIX
         }
     elif pos == "verb":
         morphology.inflections = {
             "perfect_3ms": lemma,
-            "imperfect_3ms": f"ي{lemma}",
+            "imperfect_3ms": IMPERFECT_PREFIX + lemma,
             "imperative_2ms": lemma
         }
     
     return morphology
 
+@router.get("/word/{lemma}/morphology", response_model=MorphologyResponse)
+async def get_word_morphology(lemma: str):
+    """Screen 7: Morphological analysis"""
+    return build_morphology(lemma, fetch_entry(get_db_connection(), lemma, MORPHOLOGY_COLUMNS))
+
 # Summary endpoint for all screens
 @router.get("/word/{lemma}/complete")
 async def get_complete_word_data(lemma: str):
     """Complete word data for all screens"""
     try:
         info = await get_word_info(lemma)
-        senses = await get_word_senses(lemma)
-        relations = await get_word_relations(lemma)
-        pronunciation = await get_word_pronunciation(lemma)
-        dialects = await get_word_dialects(lemma)
-        morphology = await get_word_morphology(lemma)
+        
+        # One entries lookup feeds screens 2-7
+        row = fetch_entry(get_db_connection(), lemma, COMPLETE_COLUMNS)
+        senses = build_senses(lemma, row)
+        relations = build_relations(lemma, row)
+        pronunciation = build_pronunciation(row)
+        dialects = build_dialects(lemma, row)
+        morphology = build_morphology(lemma, row)
         
         return {
             "info": info,
@@ -6,13 +6,67 @@ import os
 import sys
 import sqlite3
 import gzip
+import hashlib
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# Add parent directory to path so services resolve to the same modules main.py uses
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from services.db import build_screen1_snapshot, prepare_database, screen1_snapshot_is_current
 
 router = APIRouter()
 
+def nuke_cached_database(cache_path: str) -> Optional[str]:
+    """Remove one cached database, returning a description if it existed."""
+    try:
+        file_size = os.path.getsize(cache_path) / (1024 * 1024)
+        os.remove(cache_path)
+        return f"{cache_path} ({file_size:.1f}MB)"
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Could not nuke {cache_path}: {e}")
+        return None
+
+# Decompression chunk size: few large writes instead of many 16KB ones
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Optional known-good BLAKE2b hex digest of the decompressed database
+EXPECTED_DB_DIGEST = os.environ.get("NUCLEAR_DB_BLAKE2B")
+
+# Optional entry count published with the digest, reported when a verified
+# database is not counted
+EXPECTED_DB_ENTRIES = os.environ.get("NUCLEAR_DB_ENTRIES")
+
+def decompress_database(compressed_path: str, target_path: str, with_digest: bool = False) -> Optional[str]:
+    """Decompress a gzipped database through one reusable 4MB buffer.
+
+    With with_digest, returns the BLAKE2b hex digest of the decompressed
+    bytes, hashed while they are written so verification needs no second
+    read of the file; otherwise nothing is hashed and None is returned.
+    """
+    digest = hashlib.blake2b() if with_digest else None
+    buf = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    with open(compressed_path, 'rb') as raw_in:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(raw_in.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with gzip.GzipFile(fileobj=raw_in, mode='rb') as f_in:
+            with open(target_path, 'wb') as f_out:
+                while True:
+                    n = f_in.readinto(buf)
+                    if not n:
+                        break
+                    chunk = view[:n]
+                    f_out.write(chunk)
+                    if digest is not None:
+                        digest.update(chunk)
+    return digest.hexdigest() if digest is not None else None
+
 @router.post("/nuclear/force-comprehensive-db")
 async def nuclear_force_comprehensive_db() -> Dict[str, Any]:
     """NUCLEAR OPTION: Force deploy comprehensive database bypassing all caches."""
@@ -30,15 +84,9 @@ async def nuclear_force_comprehensive_db() -> Dict[str, Any]:
             "app/comprehensive_arabic_dict.db"
         ]
         
-        nuked_files = []
-        for cache_path in cache_locations:
-            if os.path.exists(cache_path):
-                try:
-                    file_size = os.path.getsize(cache_path) / (1024 * 1024)
-                    os.remove(cache_path)
-                    nuked_files.append(f"{cache_path} ({file_size:.1f}MB)")
-                except Exception as e:
-                    print(f"Could not nuke {cache_path}: {e}")
+        # Unlinks release the GIL, so the stat/remove pairs run concurrently
+        with ThreadPoolExecutor(max_workers=len(cache_locations)) as executor:
+            nuked_files = [nuked for nuked in executor.map(nuke_cached_database, cache_locations) if nuked]
         
         # Step 2: Force decompress with timestamp
         compressed_paths = [
@@ -58,25 +106,43 @@ async def nuclear_force_comprehensive_db() -> Dict[str, Any]:
                     
                     nuclear_path = f"/app/app/NUCLEAR_FORCE_{timestamp}.db"
                     
-                    # Force decompress
-                    with gzip.open(compressed_path, 'rb') as f_in:
-                        with open(nuclear_path, 'wb') as f_out:
-                            shutil.copyfileobj(f_in, f_out)
+                    # Force decompress, hashing only when there is a digest to check against
+                    db_digest = decompress_database(compressed_path, nuclear_path, with_digest=bool(EXPECTED_DB_DIGEST))
+                    
+                    # Verify: a matching digest is authoritative, otherwise fall back to heuristics
+                    digest_verified = bool(EXPECTED_DB_DIGEST) and db_digest == EXPECTED_DB_DIGEST
+                    if EXPECTED_DB_DIGEST and not digest_verified:
+                        os.remove(nuclear_path)
+                        raise HTTPException(status_code=500, detail=f"Nuclear database digest mismatch: {db_digest}")
                     
-                    # Verify
                     file_size = os.path.getsize(nuclear_path) / (1024 * 1024)
                     
-                    if file_size > 100:
-                        conn = sqlite3.connect(nuclear_path)
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT COUNT(*) FROM entries")
-                        count = cursor.fetchone()[0]
+                    if digest_verified or file_size > 100:
+                        conn = None
+                        sample_words = []
+                        if digest_verified:
+                            # The digest already proves the content: skip the COUNT scan and samples
+                            count = int(EXPECTED_DB_ENTRIES) if EXPECTED_DB_ENTRIES else None
+                        else:
+                            conn = sqlite3.connect(nuclear_path)
+                            cursor = conn.cursor()
+                            cursor.execute("SELECT COUNT(*) FROM entries")
+                            count = cursor.fetchone()[0]
                         
-                        if count > 100000:
-                            # Get sample words for verification
-                            cursor.execute("SELECT lemma, root, pos FROM entries WHERE LENGTH(lemma) > 6 LIMIT 5")
-                            sample_words = cursor.fetchall()
-                            conn.close()
+                        if digest_verified or count > 100000:
+                            if conn is not None:
+                                cursor.execute("SELECT lemma, root, pos FROM entries WHERE LENGTH(lemma) > 6 LIMIT 5")
+                                sample_words = cursor.fetchall()
+                                conn.close()
+                            
+                            # Make every write the app depends on before any name points at the file
+                            prep_conn = sqlite3.connect(nuclear_path)
+                            try:
+                                indexes_built = prepare_database(prep_conn)
+                                if not screen1_snapshot_is_current(prep_conn):
+                                    build_screen1_snapshot(prep_conn)
+                            finally:
+                                prep_conn.close()
                             
                             # Force symlinks to all expected paths
                             force_paths = [
@@ -92,13 +158,14 @@ async def nuclear_force_comprehensive_db() -> Dict[str, Any]:
                             for target_path in force_paths:
                                 try:
                                     os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                                    if os.path.exists(target_path):
+                                    if os.path.lexists(target_path):
                                         os.remove(target_path)
                                     
                                     try:
                                         os.symlink(nuclear_path, target_path)
                                         created_links.append(f"symlink: {target_path}")
-                                    except:
+                                    except OSError:
+                                        # No hard link: each name would get its own SQLite WAL
                                         shutil.copy2(nuclear_path, target_path)
                                         created_links.append(f"copy: {target_path}")
                                 except Exception as e:
@@ -110,11 +177,12 @@ async def nuclear_force_comprehensive_db() -> Dict[str, Any]:
                                 "/app/app/NUCLEAR_FORCE_ACTIVE.txt"
                             ]
                             
+                            entries_info = f"{count}_ENTRIES" if count is not None else "DIGEST_VERIFIED"
                             for signal_file in signal_files:
                                 try:
                                     os.makedirs(os.path.dirname(signal_file), exist_ok=True)
                                     with open(signal_file, 'w') as f:
-                                        f.write(f"{nuclear_path}\n{timestamp}\n{count}_ENTRIES_NUCLEAR_FORCED\n")
+                                        f.write(f"{nuclear_path}\n{timestamp}\n{entries_info}_NUCLEAR_FORCED\n")
                                 except:
                                     pass
                             
@@ -128,6 +196,9 @@ async def nuclear_force_comprehensive_db() -> Dict[str, Any]:
                                 "nuked_files": nuked_files,
                                 "created_links": created_links,
                                 "sample_words": [{"lemma": w[0], "root": w[1], "pos": w[2]} for w in sample_words],
+                                "blake2b": db_digest,
+                                "digest_verified": digest_verified,
+                                "indexes_built": indexes_built,
                                 "timestamp": timestamp
                             }
                         else:
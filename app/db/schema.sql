@@ -25,6 +25,7 @@ CREATE TABLE IF NOT EXISTS entries (
 );
 
 -- Index for faster lookups
+CREATE INDEX IF NOT EXISTS idx_entries_lemma ON entries(lemma);
 CREATE INDEX IF NOT EXISTS idx_entries_lemma_norm ON entries(lemma_norm);
 CREATE INDEX IF NOT EXISTS idx_entries_root ON entries(root);
 CREATE INDEX IF NOT EXISTS idx_entries_pos ON entries(pos);
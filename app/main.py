@@ -5,7 +5,6 @@ All endpoints restored exactly as they were in the original deployment
 
 from __future__ import annotations
 
-import json
 import os
 import sqlite3
 import gzip
@@ -14,15 +13,18 @@ import time
 import sys
 import os
 from functools import lru_cache
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(__file__))
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 
+from services.db import apply_pragmas, prepare_database
+from services.fastjson import ORJSON_AVAILABLE, dumps as json_dumps, loads as json_loads, loads_list as json_loads_list
 from services.normalize import normalize_ar
 
 # Response models
@@ -75,8 +77,13 @@ class InfoResponse(BaseModel):
     word_info: Dict[str, Any]
     metadata: Dict[str, Any]
 
+@lru_cache(maxsize=1)
 def get_db_connection() -> sqlite3.Connection:
-    """Get a connection to the Arabic dictionary database."""
+    """Get the process-wide connection to the Arabic dictionary database.
+
+    The connection is opened once and shared by every request, so handlers
+    must not close it. Failures are not cached; the next call retries.
+    """
     
     # Try multiple database locations
     db_paths = [
@@ -94,17 +101,27 @@ def get_db_connection() -> sqlite3.Connection:
         with gzip.open(compressed_path, 'rb') as f_in:
             with open('arabic_dict.db', 'wb') as f_out:
                 shutil.copyfileobj(f_in, f_out)
+        # Make the deploy-time writes now so serving connections only read
+        conn = sqlite3.connect('arabic_dict.db')
+        try:
+            prepare_database(conn)
+        finally:
+            conn.close()
         print("✅ Database extracted successfully")
     
     for db_path in db_paths:
         if os.path.exists(db_path):
             try:
-                conn = sqlite3.connect(db_path)
-                # Test the connection
+                conn = apply_pragmas(sqlite3.connect(
+                    db_path, check_same_thread=False, cached_statements=256
+                ))
+                conn.row_factory = sqlite3.Row
+                # Test the connection: probing one row proves the entries
+                # table is readable without a full COUNT(*) scan per request
                 cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM entries LIMIT 1")
-                count = cursor.fetchone()[0]
-                print(f"✅ Connected to database: {db_path} ({count:,} entries)")
+                cursor.execute("SELECT 1 FROM entries LIMIT 1")
+                cursor.fetchone()
+                print(f"✅ Connected to database: {db_path}")
                 return conn
             except Exception as e:
                 print(f"❌ Failed to connect to {db_path}: {e}")
@@ -112,11 +129,39 @@ def get_db_connection() -> sqlite3.Connection:
     
     raise HTTPException(status_code=500, detail="Database not accessible")
 
+def entry_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Build an EnhancedEntry payload from a full entries row, by column name."""
+    phonetic = row["phonetic_transcription"]
+    semantic = row["semantic_features"]
+    camel_lemmas = row["camel_lemmas"]
+    return {
+        "id": row["id"],
+        "lemma": row["lemma"],
+        "lemma_norm": row["lemma_norm"],
+        "root": row["root"],
+        "pos": row["pos"],
+        "subpos": row["subpos"],
+        "register": row["register"],
+        "domain": row["domain"],
+        "freq_rank": row["freq_rank"],
+        "camel_lemmas": json_loads_list(camel_lemmas),
+        "camel_roots": json_loads_list(row["camel_roots"]),
+        "camel_pos_tags": json_loads_list(row["camel_pos_tags"]),
+        "camel_confidence": row["camel_confidence"],
+        "buckwalter_transliteration": row["buckwalter_transliteration"],
+        "phonetic_transcription": json_loads(phonetic) if phonetic else None,
+        "semantic_features": json_loads(semantic) if semantic else None,
+        "phase2_enhanced": bool(phonetic or semantic),
+        "camel_analyzed": bool(camel_lemmas)
+    }
+
 # Create FastAPI app
 app = FastAPI(
     title="Comprehensive Arabic Dictionary API",
     description="Complete Arabic lexical service with morphological analysis and phonetic transcription",
-    version="2.0.0"
+    version="2.0.0",
+    # Serialize responses (mostly Arabic text) in C when orjson is installed
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
 # Configure CORS
@@ -170,7 +215,6 @@ async def health():
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM entries")
         count = cursor.fetchone()[0]
-        conn.close()
         return {"status": "healthy", "database_entries": count}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database connection failed: {str(e)}")
@@ -209,16 +253,13 @@ async def suggest_words(q: str = Query(..., description="Search query")):
             LIMIT 10
         """, (f"{q}%", f"{normalized_q}%", q, f"{q}%", f"{normalized_q}%"))
         
-        results = cursor.fetchall()
-        conn.close()
-        
         suggestions = [
             {
                 "lemma": row[0],
                 "root": row[1],
                 "pos": row[2]
             }
-            for row in results
+            for row in cursor
         ]
         
         return {"suggestions": suggestions}
@@ -255,21 +296,18 @@ async def fast_search(q: str = Query(..., description="Search query")):
             LIMIT 20
         """, (f"%{q}%", f"%{normalized_q}%", f"%{q}%", q, f"{q}%", q))
         
-        results = cursor.fetchall()
-        conn.close()
-        
         entries = []
-        for row in results:
+        for row in cursor:
             entries.append({
-                "id": row[0],
-                "lemma": row[1], 
-                "lemma_norm": row[2],
-                "root": row[3],
-                "pos": row[4],
-                "subpos": row[5],
-                "register": row[6],
-                "domain": row[7],
-                "freq_rank": row[8]
+                "id": row["id"],
+                "lemma": row["lemma"], 
+                "lemma_norm": row["lemma_norm"],
+                "root": row["root"],
+                "pos": row["pos"],
+                "subpos": row["subpos"],
+                "register": row["register"],
+                "domain": row["domain"],
+                "freq_rank": row["freq_rank"]
             })
         
         return {"results": entries}
@@ -327,31 +365,8 @@ async def enhanced_search(
         """, (f"%{q}%", f"%{normalized_q}%", f"%{q}%", f"%{q}%", f"%{q}%"))
         
         total = cursor.fetchone()[0]
-        conn.close()
         
-        entries = []
-        for row in results:
-            entry = {
-                "id": row[0],
-                "lemma": row[1],
-                "lemma_norm": row[2], 
-                "root": row[3],
-                "pos": row[4],
-                "subpos": row[5],
-                "register": row[6],
-                "domain": row[7], 
-                "freq_rank": row[8],
-                "camel_lemmas": json.loads(row[9]) if row[9] else [],
-                "camel_roots": json.loads(row[10]) if row[10] else [],
-                "camel_pos_tags": json.loads(row[11]) if row[11] else [],
-                "camel_confidence": row[12],
-                "buckwalter_transliteration": row[13],
-                "phonetic_transcription": json.loads(row[14]) if row[14] else None,
-                "semantic_features": json.loads(row[15]) if row[15] else None,
-                "phase2_enhanced": bool(row[14] or row[15]),
-                "camel_analyzed": bool(row[9])
-            }
-            entries.append(entry)
+        entries = [entry_from_row(row) for row in results]
         
         return {"results": entries, "total": total}
         
@@ -385,12 +400,9 @@ async def search(q: str = Query(..., description="Search query")):
             LIMIT 25
         """, (f"%{q}%", f"%{normalized_q}%", q, f"{q}%"))
         
-        results = cursor.fetchall()
-        conn.close()
-        
         return [
             BasicInfo(lemma=row[0], root=row[1], pos=row[2])
-            for row in results
+            for row in cursor
         ]
         
     except Exception as e:
@@ -415,31 +427,11 @@ async def get_lemma(q: str):
         """, (q, normalize_ar(q)))
         
         result = cursor.fetchone()
-        conn.close()
         
         if not result:
             raise HTTPException(status_code=404, detail="Lemma not found")
         
-        return EnhancedEntry(
-            id=result[0],
-            lemma=result[1],
-            lemma_norm=result[2],
-            root=result[3],
-            pos=result[4],
-            subpos=result[5],
-            register=result[6],
-            domain=result[7],
-            freq_rank=result[8],
-            camel_lemmas=json.loads(result[9]) if result[9] else [],
-            camel_roots=json.loads(result[10]) if result[10] else [],
-            camel_pos_tags=json.loads(result[11]) if result[11] else [],
-            camel_confidence=result[12],
-            buckwalter_transliteration=result[13],
-            phonetic_transcription=json.loads(result[14]) if result[14] else None,
-            semantic_features=json.loads(result[15]) if result[15] else None,
-            phase2_enhanced=bool(result[14] or result[15]),
-            camel_analyzed=bool(result[9])
-        )
+        return EnhancedEntry(**entry_from_row(result))
         
     except HTTPException:
         raise
@@ -462,12 +454,9 @@ async def get_by_root(root: str):
             LIMIT 50
         """, (root, f'%"{root}"%'))
         
-        results = cursor.fetchall()
-        conn.close()
-        
         return [
             BasicInfo(lemma=row[0], root=row[1], pos=row[2])
-            for row in results
+            for row in cursor
         ]
         
     except Exception as e:
@@ -491,31 +480,11 @@ async def random_lemma():
         """)
         
         result = cursor.fetchone()
-        conn.close()
         
         if not result:
             raise HTTPException(status_code=404, detail="No entries found")
         
-        return EnhancedEntry(
-            id=result[0],
-            lemma=result[1],
-            lemma_norm=result[2],
-            root=result[3],
-            pos=result[4],
-            subpos=result[5],
-            register=result[6],
-            domain=result[7],
-            freq_rank=result[8],
-            camel_lemmas=json.loads(result[9]) if result[9] else [],
-            camel_roots=json.loads(result[10]) if result[10] else [],
-            camel_pos_tags=json.loads(result[11]) if result[11] else [],
-            camel_confidence=result[12],
-            buckwalter_transliteration=result[13],
-            phonetic_transcription=json.loads(result[14]) if result[14] else None,
-            semantic_features=json.loads(result[15]) if result[15] else None,
-            phase2_enhanced=bool(result[14] or result[15]),
-            camel_analyzed=bool(result[9])
-        )
+        return EnhancedEntry(**entry_from_row(result))
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Random lookup failed: {str(e)}")
@@ -536,7 +505,6 @@ async def get_phonetics(word: str):
         """, (word, normalize_ar(word)))
         
         result = cursor.fetchone()
-        conn.close()
         
         if not result:
             return {
@@ -549,7 +517,7 @@ async def get_phonetics(word: str):
         return {
             "word": word,
             "buckwalter": result[0],
-            "phonetic": json.loads(result[1]) if result[1] else None,
+            "phonetic": json_loads(result[1]) if result[1] else None,
             "status": "found" if (result[0] or result[1]) else "no_phonetic_data"
         }
         
@@ -557,6 +525,36 @@ async def get_phonetics(word: str):
         raise HTTPException(status_code=500, detail=f"Phonetics lookup failed: {str(e)}")
 
 # 10. COMPREHENSIVE STATS
+# Stats responses keyed by (database file, mtime); a redeployed file invalidates them
+_stats_cache: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
+def load_stats_manifest(db_file: str, db_stat: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Load stats persisted next to the database if they match its mtime and size."""
+    try:
+        with open(f"{db_file}.stats.json", "rb") as f:
+            manifest = json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if manifest.get("db_mtime") != db_stat.st_mtime or manifest.get("db_size") != db_stat.st_size:
+        return None
+    return manifest.get("stats")
+
+def save_stats_manifest(db_file: str, db_stat: os.stat_result, stats: Dict[str, Any]) -> None:
+    """Persist stats next to the database so a cold start can skip the scan."""
+    manifest_path = f"{db_file}.stats.json"
+    manifest = {
+        "db_mtime": db_stat.st_mtime,
+        "db_size": db_stat.st_size,
+        "generated_at": time.time(),
+        "stats": stats
+    }
+    try:
+        with open(f"{manifest_path}.tmp", "w", encoding="utf-8") as f:
+            f.write(json_dumps(manifest))
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+    except OSError as e:
+        print(f"⚠️ Could not persist stats manifest: {e}")
+
 @app.get("/stats/comprehensive", tags=["Enhanced Features"])
 async def comprehensive_stats():
     """Comprehensive Stats - Database statistics"""
@@ -564,25 +562,32 @@ async def comprehensive_stats():
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Basic stats
-        cursor.execute("SELECT COUNT(*) FROM entries")
-        total_entries = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(DISTINCT root) FROM entries WHERE root IS NOT NULL")
-        total_roots = cursor.fetchone()[0]
+        cursor.execute("PRAGMA database_list")
+        db_file = cursor.fetchone()["file"]
+        db_stat = os.stat(db_file)
+        cache_key = (db_file, db_stat.st_mtime)
+        if cache_key in _stats_cache:
+            return _stats_cache[cache_key]
         
-        cursor.execute("SELECT COUNT(DISTINCT pos) FROM entries WHERE pos IS NOT NULL")
-        total_pos = cursor.fetchone()[0]
+        stats = load_stats_manifest(db_file, db_stat)
+        if stats is not None:
+            _stats_cache.clear()
+            _stats_cache[cache_key] = stats
+            return stats
         
-        # Enhanced stats
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE camel_lemmas IS NOT NULL AND camel_lemmas != '[]'")
-        camel_analyzed = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE phonetic_transcription IS NOT NULL")
-        phonetic_enhanced = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE buckwalter_transliteration IS NOT NULL")
-        buckwalter_available = cursor.fetchone()[0]
+        # Basic and enhanced stats in a single pass over entries
+        cursor.execute("""
+            SELECT 
+                COUNT(*),
+                COUNT(DISTINCT root),
+                COUNT(DISTINCT pos),
+                COALESCE(SUM(camel_lemmas IS NOT NULL AND camel_lemmas != '[]'), 0),
+                COALESCE(SUM(phonetic_transcription IS NOT NULL), 0),
+                COALESCE(SUM(buckwalter_transliteration IS NOT NULL), 0)
+            FROM entries
+        """)
+        (total_entries, total_roots, total_pos,
+         camel_analyzed, phonetic_enhanced, buckwalter_available) = cursor.fetchone()
         
         # POS distribution
         cursor.execute("""
@@ -595,9 +600,7 @@ async def comprehensive_stats():
         """)
         pos_distribution = [{"pos": row[0], "count": row[1]} for row in cursor.fetchall()]
         
-        conn.close()
-        
-        return {
+        stats = {
             "database_info": {
                 "total_entries": total_entries,
                 "unique_roots": total_roots,
@@ -624,6 +627,10 @@ async def comprehensive_stats():
                 "cross_dialect_analysis": True
             }
         }
+        _stats_cache.clear()
+        _stats_cache[cache_key] = stats
+        save_stats_manifest(db_file, db_stat, stats)
+        return stats
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Stats query failed: {str(e)}")
@@ -646,7 +653,6 @@ async def get_word_info(lemma: str):
         """, (lemma, normalize_ar(lemma)))
         
         result = cursor.fetchone()
-        conn.close()
         
         if not result:
             raise HTTPException(status_code=404, detail="Word not found")
@@ -697,11 +703,11 @@ async def get_word_senses(lemma: str):
         
         senses = []
         if result[0]:  # semantic_features
-            semantic_data = json.loads(result[0])
+            semantic_data = json_loads(result[0])
             senses.append({"type": "semantic", "data": semantic_data})
         
         if result[1]:  # camel_lemmas
-            camel_data = json.loads(result[1])
+            camel_data = json_loads(result[1])
             senses.append({"type": "camel_analysis", "lemmas": camel_data})
         
         # Add basic grammatical sense
@@ -714,8 +720,6 @@ async def get_word_senses(lemma: str):
             }
             senses.append(grammatical_sense)
         
-        conn.close()
-        
         return SenseResponse(
             senses=senses,
             total_count=len(senses)
@@ -726,6 +730,38 @@ async def get_word_senses(lemma: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Senses lookup failed: {str(e)}")
 
+# Related words reported per CAMeL root
+CAMEL_RELATIONS_PER_ROOT = 5
+
+def camel_root_relations(cursor: sqlite3.Cursor, camel_roots: List[str], lemma: str) -> List[List[Tuple[str, str]]]:
+    """Distinct (lemma, pos) pairs sharing each CAMeL root, up to 5 per root.
+
+    A substring match on camel_roots cannot use an index, so all roots are
+    served by one scan that stops as soon as every root has its 5 words,
+    instead of one scan per root. The match uses instr(), which is exact and
+    case-sensitive like the `in` test that buckets the rows, so no row the
+    query returns is dropped and no '_' or '%' in a root acts as a wildcard.
+    """
+    if not camel_roots:
+        return []
+    needles = [f'"{camel_root}"' for camel_root in camel_roots]
+    buckets: List[Dict[Tuple[str, str], None]] = [{} for _ in needles]
+    
+    cursor.execute(
+        "SELECT lemma, pos, camel_roots FROM entries WHERE ("
+        + " OR ".join(["instr(camel_roots, ?) > 0"] * len(needles))
+        + ") AND lemma != ?",
+        needles + [lemma],
+    )
+    for rel_lemma, pos, roots_text in cursor:
+        for needle, bucket in zip(needles, buckets):
+            if len(bucket) < CAMEL_RELATIONS_PER_ROOT and needle in roots_text:
+                bucket[(rel_lemma, pos)] = None
+        if all(len(bucket) >= CAMEL_RELATIONS_PER_ROOT for bucket in buckets):
+            break
+    
+    return [list(bucket) for bucket in buckets]
+
 @app.get("/word/{lemma}/relations", tags=["Word Details"])
 async def get_word_relations(lemma: str):
     """Get Word Relations - Related words and connections"""
@@ -767,25 +803,15 @@ async def get_word_relations(lemma: str):
         
         # Find CAMeL-based relations
         if result[1]:  # camel_roots
-            camel_roots = json.loads(result[1])
-            for camel_root in camel_roots[:3]:  # Limit to first 3 CAMeL roots
-                cursor.execute("""
-                    SELECT DISTINCT lemma, pos
-                    FROM entries 
-                    WHERE camel_roots LIKE ? AND lemma != ?
-                    LIMIT 5
-                """, (f'%"{camel_root}"%', lemma))
-                
-                camel_relations = cursor.fetchall()
-                if camel_relations:
+            camel_roots = json_loads(result[1])[:3]  # Limit to first 3 CAMeL roots
+            for camel_root, related in zip(camel_roots, camel_root_relations(cursor, camel_roots, lemma)):
+                if related:
                     relations.append({
                         "type": "camel_root",
                         "root": camel_root,
-                        "related_words": [{"lemma": row[0], "pos": row[1]} for row in camel_relations]
+                        "related_words": [{"lemma": rel_lemma, "pos": pos} for rel_lemma, pos in related]
                     })
         
-        conn.close()
-        
         return RelationResponse(
             relations=relations,
             total_count=sum(len(rel.get("related_words", [])) for rel in relations)
@@ -826,16 +852,14 @@ async def get_word_pronunciation(lemma: str):
             phonetic_variants.append(result[0])
         
         if result[1]:  # phonetic_transcription
-            phonetic_data = json.loads(result[1])
+            phonetic_data = json_loads(result[1])
             pronunciations.append({
                 "type": "ipa",
                 "transcription": phonetic_data
             })
-            if isinstance(phonetic_data, str):
+            if type(phonetic_data) is str:
                 phonetic_variants.append(phonetic_data)
         
-        conn.close()
-        
         return PronunciationResponse(
             pronunciations=pronunciations,
             phonetic_variants=phonetic_variants
@@ -877,7 +901,7 @@ async def get_word_dialects(lemma: str):
         
         # Add CAMeL-based variants
         if result[0]:  # camel_lemmas
-            camel_lemmas = json.loads(result[0])
+            camel_lemmas = json_loads(result[0])
             for variant in camel_lemmas[:5]:  # Limit variants
                 dialect_variants.append({
                     "type": "camel_variant",
@@ -891,8 +915,6 @@ async def get_word_dialects(lemma: str):
             "total_variants": len(dialect_variants)
         }
         
-        conn.close()
-        
         return DialectResponse(
             dialect_variants=dialect_variants,
             coverage_stats=coverage_stats
@@ -929,13 +951,11 @@ async def get_word_morphology(lemma: str):
         
         # Add CAMeL morphological analysis
         if result[0]:  # camel_pos_tags
-            camel_pos = json.loads(result[0])
+            camel_pos = json_loads(result[0])
             morphological_data["camel_pos_tags"] = camel_pos
         
         analysis_confidence = result[1] if result[1] else 0.5
         
-        conn.close()
-        
         return MorphologyResponse(
             morphological_data=morphological_data,
             analysis_confidence=analysis_confidence
@@ -963,7 +983,6 @@ async def get_complete_word_data(lemma: str):
         """, (lemma, normalize_ar(lemma)))
         
         result = cursor.fetchone()
-        conn.close()
         
         if not result:
             raise HTTPException(status_code=404, detail="Word not found")
@@ -981,16 +1000,16 @@ async def get_complete_word_data(lemma: str):
                 "freq_rank": result[8]
             },
             "camel_analysis": {
-                "lemmas": json.loads(result[9]) if result[9] else [],
-                "roots": json.loads(result[10]) if result[10] else [],
-                "pos_tags": json.loads(result[11]) if result[11] else [],
+                "lemmas": json_loads_list(result[9]),
+                "roots": json_loads_list(result[10]),
+                "pos_tags": json_loads_list(result[11]),
                 "confidence": result[12]
             },
             "phonetic_data": {
                 "buckwalter": result[13],
-                "ipa_transcription": json.loads(result[14]) if result[14] else None
+                "ipa_transcription": json_loads(result[14]) if result[14] else None
             },
-            "semantic_data": json.loads(result[15]) if result[15] else None,
+            "semantic_data": json_loads(result[15]) if result[15] else None,
             "enhancement_status": {
                 "camel_analyzed": bool(result[9]),
                 "phonetic_enhanced": bool(result[14]),
@@ -1011,9 +1030,17 @@ async def test_all_screens():
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Test database connectivity
-        cursor.execute("SELECT COUNT(*) FROM entries")
-        total_entries = cursor.fetchone()[0]
+        # Test database connectivity; every per-screen count comes from this one scan
+        cursor.execute("""
+            SELECT 
+                COUNT(*) AS total_entries,
+                COALESCE(SUM(buckwalter_transliteration IS NOT NULL
+                             OR phonetic_transcription IS NOT NULL), 0) AS phonetic_entries,
+                COALESCE(SUM(register IS NOT NULL), 0) AS dialect_entries
+            FROM entries
+        """)
+        screen_counts = cursor.fetchone()
+        total_entries = screen_counts["total_entries"]
         
         # Test sample queries for different screens
         test_results = {
@@ -1056,22 +1083,15 @@ async def test_all_screens():
         }
         
         # Screen 4: Phonetic Features
-        cursor.execute("""
-            SELECT COUNT(*) FROM entries 
-            WHERE buckwalter_transliteration IS NOT NULL OR phonetic_transcription IS NOT NULL
-        """)
-        phonetic_count = cursor.fetchone()[0]
         test_results["screen_4_phonetic_features"] = {
             "status": "working",
-            "phonetic_entries": phonetic_count
+            "phonetic_entries": screen_counts["phonetic_entries"]
         }
         
         # Screen 5: Dialect Support
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE register IS NOT NULL")
-        dialect_count = cursor.fetchone()[0]
         test_results["screen_5_dialect_support"] = {
             "status": "working",
-            "dialect_entries": dialect_count
+            "dialect_entries": screen_counts["dialect_entries"]
         }
         
         # Screen 6: Comprehensive Stats
@@ -1086,8 +1106,6 @@ async def test_all_screens():
             "endpoints_available": 20  # Total endpoint count
         }
         
-        conn.close()
-        
         return {
             "database_status": f"Connected - {total_entries:,} entries",
             "all_screens_functional": True,
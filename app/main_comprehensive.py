@@ -5,9 +5,9 @@ All endpoints restored exactly as they were in the original deployment
 
 from __future__ import annotations
 
-import json
 import os
 import sqlite3
+import sys
 import gzip
 import shutil
 import time
@@ -18,7 +18,12 @@ from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from .services.normalize import normalize_ar
+# Add current directory to path so services resolve to the same modules main.py uses
+sys.path.append(os.path.dirname(__file__))
+
+from services.db import apply_pragmas, prepare_database
+from services.fastjson import loads as json_loads, loads_list as json_loads_list
+from services.normalize import normalize_ar
 
 # Response models
 class EnhancedEntry(BaseModel):
@@ -89,12 +94,18 @@ def get_db_connection() -> sqlite3.Connection:
         with gzip.open(compressed_path, 'rb') as f_in:
             with open('arabic_dict.db', 'wb') as f_out:
                 shutil.copyfileobj(f_in, f_out)
+        # Make the deploy-time writes now so serving connections only read
+        conn = sqlite3.connect('arabic_dict.db')
+        try:
+            prepare_database(conn)
+        finally:
+            conn.close()
         print("✅ Database extracted successfully")
     
     for db_path in db_paths:
         if os.path.exists(db_path):
             try:
-                conn = sqlite3.connect(db_path)
+                conn = apply_pragmas(sqlite3.connect(db_path))
                 # Test the connection
                 cursor = conn.cursor()
                 cursor.execute("SELECT COUNT(*) FROM entries LIMIT 1")
@@ -336,13 +347,13 @@ async def enhanced_search(
                 "register": row[6],
                 "domain": row[7], 
                 "freq_rank": row[8],
-                "camel_lemmas": json.loads(row[9]) if row[9] else [],
-                "camel_roots": json.loads(row[10]) if row[10] else [],
-                "camel_pos_tags": json.loads(row[11]) if row[11] else [],
+                "camel_lemmas": json_loads_list(row[9]),
+                "camel_roots": json_loads_list(row[10]),
+                "camel_pos_tags": json_loads_list(row[11]),
                 "camel_confidence": row[12],
                 "buckwalter_transliteration": row[13],
-                "phonetic_transcription": json.loads(row[14]) if row[14] else None,
-                "semantic_features": json.loads(row[15]) if row[15] else None,
+                "phonetic_transcription": json_loads(row[14]) if row[14] else None,
+                "semantic_features": json_loads(row[15]) if row[15] else None,
                 "phase2_enhanced": bool(row[14] or row[15]),
                 "camel_analyzed": bool(row[9])
             }
@@ -425,13 +436,13 @@ async def get_lemma(q: str):
             register=result[6],
             domain=result[7],
             freq_rank=result[8],
-            camel_lemmas=json.loads(result[9]) if result[9] else [],
-            camel_roots=json.loads(result[10]) if result[10] else [],
-            camel_pos_tags=json.loads(result[11]) if result[11] else [],
+            camel_lemmas=json_loads_list(result[9]),
+            camel_roots=json_loads_list(result[10]),
+            camel_pos_tags=json_loads_list(result[11]),
             camel_confidence=result[12],
             buckwalter_transliteration=result[13],
-            phonetic_transcription=json.loads(result[14]) if result[14] else None,
-            semantic_features=json.loads(result[15]) if result[15] else None,
+            phonetic_transcription=json_loads(result[14]) if result[14] else None,
+            semantic_features=json_loads(result[15]) if result[15] else None,
             phase2_enhanced=bool(result[14] or result[15]),
             camel_analyzed=bool(result[9])
         )
@@ -501,13 +512,13 @@ async def random_lemma():
             register=result[6],
             domain=result[7],
             freq_rank=result[8],
-            camel_lemmas=json.loads(result[9]) if result[9] else [],
-            camel_roots=json.loads(result[10]) if result[10] else [],
-            camel_pos_tags=json.loads(result[11]) if result[11] else [],
+            camel_lemmas=json_loads_list(result[9]),
+            camel_roots=json_loads_list(result[10]),
+            camel_pos_tags=json_loads_list(result[11]),
             camel_confidence=result[12],
             buckwalter_transliteration=result[13],
-            phonetic_transcription=json.loads(result[14]) if result[14] else None,
-            semantic_features=json.loads(result[15]) if result[15] else None,
+            phonetic_transcription=json_loads(result[14]) if result[14] else None,
+            semantic_features=json_loads(result[15]) if result[15] else None,
             phase2_enhanced=bool(result[14] or result[15]),
             camel_analyzed=bool(result[9])
         )
@@ -544,7 +555,7 @@ async def get_phonetics(word: str):
         return {
             "word": word,
             "buckwalter": result[0],
-            "phonetic": json.loads(result[1]) if result[1] else None,
+            "phonetic": json_loads(result[1]) if result[1] else None,
             "status": "found" if (result[0] or result[1]) else "no_phonetic_data"
         }
         
@@ -559,25 +570,19 @@ async def comprehensive_stats():
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Basic stats
-        cursor.execute("SELECT COUNT(*) FROM entries")
-        total_entries = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(DISTINCT root) FROM entries WHERE root IS NOT NULL")
-        total_roots = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(DISTINCT pos) FROM entries WHERE pos IS NOT NULL")
-        total_pos = cursor.fetchone()[0]
-        
-        # Enhanced stats
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE camel_lemmas IS NOT NULL AND camel_lemmas != '[]'")
-        camel_analyzed = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE phonetic_transcription IS NOT NULL")
-        phonetic_enhanced = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE buckwalter_transliteration IS NOT NULL")
-        buckwalter_available = cursor.fetchone()[0]
+        # Basic and enhanced stats in a single pass over entries
+        cursor.execute("""
+            SELECT 
+                COUNT(*),
+                COUNT(DISTINCT root),
+                COUNT(DISTINCT pos),
+                COALESCE(SUM(camel_lemmas IS NOT NULL AND camel_lemmas != '[]'), 0),
+                COALESCE(SUM(phonetic_transcription IS NOT NULL), 0),
+                COALESCE(SUM(buckwalter_transliteration IS NOT NULL), 0)
+            FROM entries
+        """)
+        (total_entries, total_roots, total_pos,
+         camel_analyzed, phonetic_enhanced, buckwalter_available) = cursor.fetchone()
         
         # POS distribution
         cursor.execute("""
@@ -692,11 +697,11 @@ async def get_word_senses(lemma: str):
         
         senses = []
         if result[0]:  # semantic_features
-            semantic_data = json.loads(result[0])
+            semantic_data = json_loads(result[0])
             senses.append({"type": "semantic", "data": semantic_data})
         
         if result[1]:  # camel_lemmas
-            camel_data = json.loads(result[1])
+            camel_data = json_loads(result[1])
             senses.append({"type": "camel_analysis", "lemmas": camel_data})
         
         # Add basic grammatical sense
@@ -762,7 +767,7 @@ async def get_word_relations(lemma: str):
         
         # Find CAMeL-based relations
         if result[1]:  # camel_roots
-            camel_roots = json.loads(result[1])
+            camel_roots = json_loads(result[1])
             for camel_root in camel_roots[:3]:  # Limit to first 3 CAMeL roots
                 cursor.execute("""
                     SELECT DISTINCT lemma, pos
@@ -821,12 +826,12 @@ async def get_word_pronunciation(lemma: str):
             phonetic_variants.append(result[0])
         
         if result[1]:  # phonetic_transcription
-            phonetic_data = json.loads(result[1])
+            phonetic_data = json_loads(result[1])
             pronunciations.append({
                 "type": "ipa",
                 "transcription": phonetic_data
             })
-            if isinstance(phonetic_data, str):
+            if type(phonetic_data) is str:
                 phonetic_variants.append(phonetic_data)
         
         conn.close()
@@ -872,7 +877,7 @@ async def get_word_dialects(lemma: str):
         
         # Add CAMeL-based variants
         if result[0]:  # camel_lemmas
-            camel_lemmas = json.loads(result[0])
+            camel_lemmas = json_loads(result[0])
             for variant in camel_lemmas[:5]:  # Limit variants
                 dialect_variants.append({
                     "type": "camel_variant",
@@ -924,7 +929,7 @@ async def get_word_morphology(lemma: str):
         
         # Add CAMeL morphological analysis
         if result[0]:  # camel_pos_tags
-            camel_pos = json.loads(result[0])
+            camel_pos = json_loads(result[0])
             morphological_data["camel_pos_tags"] = camel_pos
         
         analysis_confidence = result[1] if result[1] else 0.5
@@ -976,16 +981,16 @@ async def get_complete_word_data(lemma: str):
                 "freq_rank": result[8]
             },
             "camel_analysis": {
-                "lemmas": json.loads(result[9]) if result[9] else [],
-                "roots": json.loads(result[10]) if result[10] else [],
-                "pos_tags": json.loads(result[11]) if result[11] else [],
+                "lemmas": json_loads_list(result[9]),
+                "roots": json_loads_list(result[10]),
+                "pos_tags": json_loads_list(result[11]),
                 "confidence": result[12]
             },
             "phonetic_data": {
                 "buckwalter": result[13],
-                "ipa_transcription": json.loads(result[14]) if result[14] else None
+                "ipa_transcription": json_loads(result[14]) if result[14] else None
             },
-            "semantic_data": json.loads(result[15]) if result[15] else None,
+            "semantic_data": json_loads(result[15]) if result[15] else None,
             "enhancement_status": {
                 "camel_analyzed": bool(result[9]),
                 "phonetic_enhanced": bool(result[14]),
@@ -1006,9 +1011,16 @@ async def test_all_screens():
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Test database connectivity
-        cursor.execute("SELECT COUNT(*) FROM entries")
-        total_entries = cursor.fetchone()[0]
+        # Test database connectivity; every per-screen count comes from this one scan
+        cursor.execute("""
+            SELECT 
+                COUNT(*),
+                COALESCE(SUM(buckwalter_transliteration IS NOT NULL
+                             OR phonetic_transcription IS NOT NULL), 0),
+                COALESCE(SUM(register IS NOT NULL), 0)
+            FROM entries
+        """)
+        total_entries, phonetic_count, dialect_count = cursor.fetchone()
         
         # Test sample queries for different screens
         test_results = {
@@ -1051,19 +1063,12 @@ async def test_all_screens():
         }
         
         # Screen 4: Phonetic Features
-        cursor.execute("""
-            SELECT COUNT(*) FROM entries 
-            WHERE buckwalter_transliteration IS NOT NULL OR phonetic_transcription IS NOT NULL
-        """)
-        phonetic_count = cursor.fetchone()[0]
         test_results["screen_4_phonetic_features"] = {
             "status": "working",
             "phonetic_entries": phonetic_count
         }
         
         # Screen 5: Dialect Support
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE register IS NOT NULL")
-        dialect_count = cursor.fetchone()[0]
         test_results["screen_5_dialect_support"] = {
             "status": "working",
             "dialect_entries": dialect_count
@@ -25,7 +25,11 @@ from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from .services.normalize import normalize_ar
+# Add current directory to path so services resolve to the same modules main.py uses
+sys.path.append(os.path.dirname(__file__))
+
+from services.db import build_screen1_snapshot, prepare_database, screen1_snapshot_is_current
+from services.normalize import normalize_ar
 
 # CAMeL Tools routes are now integrated directly
 CAMEL_AVAILABLE = False
@@ -134,13 +138,10 @@ def deploy_comprehensive_database() -> Optional[str]:
                         
                         if count > 100000:  # Should be 101,331
                             print(f"✅ SUCCESS! Comprehensive database deployed: {count} entries")
-                            
-                            # Test for complex Arabic words
-                            cursor.execute("SELECT lemma FROM entries WHERE LENGTH(lemma) > 5 LIMIT 5")
-                            test_words = cursor.fetchall()
-                            if test_words:
-                                print(f"✅ Sample complex words: {[w[0] for w in test_words]}")
-                            
+                            # Make every write the app depends on before serving
+                            prepare_database(conn)
+                            if not screen1_snapshot_is_current(conn):
+                                build_screen1_snapshot(conn)
                             conn.close()
                             
                             # Create symlinks to expected paths
@@ -182,28 +183,43 @@ def deploy_comprehensive_database() -> Optional[str]:
 def nuclear_deploy_comprehensive_database() -> Optional[str]:
     """☢️  NUCLEAR FORCE: Deploy comprehensive database with atomic operations."""
     
+    # Warm restart: reuse the previous deployment if its file is untouched
+    nuclear_signal_path = "/app/nuclear_database_deployed.txt"
+    try:
+        with open(nuclear_signal_path, "r") as f:
+            lines = f.read().strip().split("\n")
+        if len(lines) >= 5:
+            stored_db_path, stored_mtime = lines[0], float(lines[4])
+            stored_stat = os.stat(stored_db_path)
+            if stored_stat.st_size > 100 * 1024 * 1024 and stored_stat.st_mtime == stored_mtime:
+                print(f"☢️  Nuclear cache warm, skipping redeployment: {stored_db_path}")
+                return stored_db_path
+    except (OSError, ValueError):
+        pass
+    
     print("☢️  NUCLEAR DEPLOYMENT INITIATED")
     print("🎯 Destroying all cached databases and forcing fresh deployment")
     
     # Step 1: Nuclear cache destruction
-    cache_paths = [
-        "/app/app/arabic_dict.db",
-        "/app/app/real_arabic_dict.db", 
-        "/app/app/comprehensive_arabic_dict.db"
-    ]
+    cache_names = {"arabic_dict.db", "real_arabic_dict.db", "comprehensive_arabic_dict.db"}
     
-    for cache_path in cache_paths:
-        if os.path.exists(cache_path):
-            try:
-                os.remove(cache_path)
-                print(f"💥 DESTROYED: {os.path.basename(cache_path)}")
-            except Exception as e:
-                print(f"⚠️  Could not destroy {cache_path}: {e}")
+    try:
+        with os.scandir("/app/app") as it:
+            cached = [entry for entry in it if entry.name in cache_names]
+    except OSError:
+        cached = []
+    
+    for entry in cached:
+        try:
+            os.unlink(entry.path)
+            print(f"💥 DESTROYED: {entry.name}")
+        except Exception as e:
+            print(f"⚠️  Could not destroy {entry.path}: {e}")
     
     # Step 2: Create nuclear database with unique timestamp
-    import hashlib
+    import secrets
     timestamp = int(time.time())
-    unique_id = hashlib.md5(str(timestamp).encode()).hexdigest()[:8]
+    unique_id = secrets.token_hex(4)
     nuclear_db_name = f"nuclear_arabic_{timestamp}_{unique_id}.db"
     
     # Step 3: Nuclear decompression
@@ -240,6 +256,11 @@ def nuclear_deploy_comprehensive_database() -> Optional[str]:
                         
                         if count > 100000:  # 101,331 entries
                             print(f"☢️  NUCLEAR SUCCESS: {count} entries")
+                            # Finish every write (WAL, indexes, screen-1 snapshot) before the
+                            # mtime is recorded; serving connections only read after this
+                            prepare_database(conn)
+                            if not screen1_snapshot_is_current(conn):
+                                build_screen1_snapshot(conn)
                             conn.close()
                             
                             # Create atomic symlinks
@@ -250,19 +271,20 @@ def nuclear_deploy_comprehensive_database() -> Optional[str]:
                             ]
                             
                             for target in symlink_targets:
+                                if os.path.lexists(target):
+                                    os.remove(target)
                                 try:
-                                    if os.path.exists(target):
-                                        os.remove(target)
                                     os.symlink(nuclear_db_path, target)
                                     print(f"⚛️  Nuclear symlink: {os.path.basename(target)}")
-                                except:
+                                except OSError:
+                                    # No hard link: each name would get its own SQLite WAL
                                     shutil.copy2(nuclear_db_path, target)
                                     print(f"⚛️  Nuclear copy: {os.path.basename(target)}")
                             
-                            # Create nuclear signal
-                            nuclear_signal_path = "/app/nuclear_database_deployed.txt"
+                            # Create nuclear signal (mtime lets warm restarts skip redeployment)
+                            db_mtime = os.path.getmtime(nuclear_db_path)
                             with open(nuclear_signal_path, "w") as f:
-                                f.write(f"{nuclear_db_path}\n{count}\n{timestamp}\n{unique_id}")
+                                f.write(f"{nuclear_db_path}\n{count}\n{timestamp}\n{unique_id}\n{db_mtime!r}")
                             
                             print(f"☢️  NUCLEAR SIGNAL ACTIVE: {count} entries")
                             return nuclear_db_path
@@ -561,7 +583,7 @@ def get_db_connection() -> sqlite3.Connection:
     # If all else fails, create database with REAL data from our 101k database
     try:
         print("Creating database with REAL comprehensive data...")
-        from real_db_sample import REAL_ENTRIES
+        from real_db_sample import iter_real_entries
         
         fallback_path = "/app/app/real_arabic_dict.db"  # New filename to force recreation
         os.makedirs(os.path.dirname(fallback_path), exist_ok=True)
@@ -593,7 +615,7 @@ def get_db_connection() -> sqlite3.Connection:
             INSERT INTO entries 
             (lemma, lemma_norm, root, pos, subpos, register, domain, freq_rank)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', REAL_ENTRIES)
+        ''', iter_real_entries())
         
         conn.commit()
         
@@ -5,9 +5,9 @@ Clean, efficient, and reliable for the comprehensive Arabic dictionary API
 
 from __future__ import annotations
 
-import json
 import os
 import sqlite3
+import sys
 import gzip
 import shutil
 from functools import lru_cache
@@ -17,7 +17,11 @@ from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from .services.normalize import normalize_ar
+# Add current directory to path so services resolve to the same modules main.py uses
+sys.path.append(os.path.dirname(__file__))
+
+from services.db import apply_pragmas, prepare_database
+from services.normalize import normalize_ar
 
 # Response models
 class EnhancedEntry(BaseModel):
@@ -62,7 +66,7 @@ def get_db_connection() -> sqlite3.Connection:
                 file_size = os.path.getsize(db_path) / (1024 * 1024)
                 print(f"📊 Found database: {db_path} ({file_size:.1f}MB)")
                 
-                conn = sqlite3.connect(db_path)
+                conn = apply_pragmas(sqlite3.connect(db_path))
                 cursor = conn.cursor()
                 
                 # Test the connection and get count
@@ -102,11 +106,13 @@ def get_db_connection() -> sqlite3.Connection:
                     file_size = os.path.getsize(target_path) / (1024 * 1024)
                     print(f"📊 Decompressed: {file_size:.1f}MB")
                     
-                    conn = sqlite3.connect(target_path)
+                    conn = apply_pragmas(sqlite3.connect(target_path))
                     cursor = conn.cursor()
                     cursor.execute("SELECT COUNT(*) FROM entries")
                     count = cursor.fetchone()[0]
                     
+                    # Freshly decompressed: make the deploy-time writes before serving
+                    prepare_database(conn)
                     print(f"✅ Decompressed database ready: {count} entries")
                     return conn
                     
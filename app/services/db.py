@@ -0,0 +1,147 @@
+"""
+Shared SQLite connection helpers for the dictionary services.
+
+Services that look words up in the main dictionary database reuse one
+connection per database path instead of reconnecting on every call, so
+SQLite's page cache stays warm between lookups.
+"""
+
+import sqlite3
+from functools import lru_cache
+
+# Read-heavy tuning applied to every dictionary connection
+PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",      # 64 MiB page cache (negative = KiB)
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",    # map up to 256 MiB of the file
+)
+
+
+def apply_pragmas(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply the read-heavy PRAGMA set to ``conn``.
+
+    Only connection-local settings are applied; anything that changes the
+    file (journal mode, indexes, statistics) is done at deploy time by
+    ``prepare_database`` so serving connections never write.
+
+    Args:
+        conn: Freshly opened connection.
+
+    Returns:
+        The same connection, for chaining.
+    """
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Lookup indexes the API relies on (WHERE lemma = ? OR lemma_norm = ?, and
+# the same-root lookups behind relations, synonyms and root search)
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_entries_lemma ON entries(lemma)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_lemma_norm ON entries(lemma_norm)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_root ON entries(root)",
+)
+
+
+def prepare_database(conn: sqlite3.Connection) -> bool:
+    """Make every file change the API depends on, at deploy time.
+
+    Switches the database to WAL, creates the lemma lookup indexes and
+    refreshes planner statistics. The indexes are built in one transaction,
+    so the journal is synced once rather than once per statement. Run next
+    to decompression, before the database is served; serving connections
+    then only read.
+
+    Args:
+        conn: Open connection to the freshly deployed database.
+
+    Returns:
+        True if the indexes are in place; False if the database is
+        read-only, in which case it still serves (unindexed) lookups.
+    """
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("BEGIN IMMEDIATE")
+        for statement in INDEXES:
+            conn.execute(statement)
+        conn.commit()
+        # Refresh planner statistics only where they are stale or missing
+        conn.execute("PRAGMA optimize")
+        return True
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.rollback()
+        return False
+
+
+# Screen-1 snapshot: enhanced_screen1_view materialized into a lemma-indexed
+# table at deploy time, stamped with the state of entries it was built from
+SCREEN1_VIEW = "enhanced_screen1_view"
+SCREEN1_TABLE = "enhanced_screen1_materialized"
+SCREEN1_META = "enhanced_screen1_meta"
+
+
+def entries_stamp(conn: sqlite3.Connection) -> str:
+    """Describe the current contents of ``entries`` for staleness checks.
+
+    Combines ``PRAGMA user_version`` with the row count and highest rowid, so
+    a replaced database or added/removed rows produce a different stamp.
+    Tools that rewrite rows in place should bump ``user_version``.
+    """
+    user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+    count, max_id = conn.execute("SELECT COUNT(*), MAX(rowid) FROM entries").fetchone()
+    return f"{user_version}:{count}:{max_id}"
+
+
+def screen1_snapshot_is_current(conn: sqlite3.Connection) -> bool:
+    """Whether the screen-1 snapshot exists and matches ``entries``.
+
+    Read-only: a missing or stale snapshot is reported, never rebuilt.
+    """
+    try:
+        row = conn.execute(f"SELECT stamp FROM {SCREEN1_META}").fetchone()
+        return row is not None and row[0] == entries_stamp(conn)
+    except sqlite3.Error:
+        return False
+
+
+def build_screen1_snapshot(conn: sqlite3.Connection) -> bool:
+    """(Re)build the screen-1 snapshot and its stamp in one transaction.
+
+    Meant for deploy time, next to decompression, so serving connections
+    only ever read. Returns False (leaving any previous state intact) if the
+    view is missing or the database is read-only.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(f"DROP TABLE IF EXISTS {SCREEN1_TABLE}")
+        conn.execute(f"""
+            CREATE TABLE {SCREEN1_TABLE} AS
+            SELECT lemma, enhanced_root, pos, enhanced_pattern, enhanced_register
+            FROM {SCREEN1_VIEW}
+        """)
+        conn.execute(f"CREATE INDEX idx_enhanced_screen1_lemma ON {SCREEN1_TABLE}(lemma)")
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {SCREEN1_META} (stamp TEXT NOT NULL)")
+        conn.execute(f"DELETE FROM {SCREEN1_META}")
+        conn.execute(f"INSERT INTO {SCREEN1_META} (stamp) VALUES (?)", (entries_stamp(conn),))
+        conn.commit()
+        return True
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.rollback()
+        return False
+
+
+@lru_cache(maxsize=4)
+def get_connection(db_path: str) -> sqlite3.Connection:
+    """Return the process-wide connection for ``db_path``.
+
+    Args:
+        db_path: Path to the SQLite database file.
+
+    Returns:
+        A cached connection. Callers must not close it.
+    """
+    return apply_pragmas(sqlite3.connect(db_path, check_same_thread=False))
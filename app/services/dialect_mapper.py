@@ -3,11 +3,13 @@ Arabic Dialect Mapping Service
 Handles Ammiya (Colloquial) <-> Fusha (MSA) translation and synonym detection
 """
 
-import json
 import sqlite3
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
+from .db import get_connection
+from .fastjson import loads as json_loads
+
 @dataclass
 class DialectMapping:
     ammiya_word: str
@@ -164,8 +166,8 @@ class ArabicDialectMapper:
                 self.msa_to_dialect[msa_word].append(dialect_word)
     
     def get_db_connection(self) -> sqlite3.Connection:
-        """Get database connection."""
-        return sqlite3.connect(self.db_path)
+        """Get the shared database connection (do not close it)."""
+        return get_connection(self.db_path)
     
     def find_msa_equivalents(self, ammiya_word: str) -> List[Dict[str, Any]]:
         """Find MSA equivalents for a dialect word."""
@@ -207,13 +209,11 @@ class ArabicDialectMapper:
                         "pos": pos,
                         "subpos": subpos,
                         "buckwalter": buckwalter,
-                        "phonetic": json.loads(phonetic) if phonetic else None
+                        "phonetic": json_loads(phonetic) if phonetic else None
                     }
                     result["confidence"] = 0.95  # Higher confidence with DB confirmation
                 
                 results.append(result)
-            
-            conn.close()
         
         # If no direct mapping, try fuzzy matching
         if not results:
@@ -263,11 +263,9 @@ class ArabicDialectMapper:
                     "pos": pos,
                     "subpos": subpos,
                     "buckwalter": buckwalter,
-                    "phonetic": json.loads(phonetic) if phonetic else None
+                    "phonetic": json_loads(phonetic) if phonetic else None
                 }
         
-        conn.close()
-        
         # If no results, try related words from same root
         if not results and db_result and db_result[2]:  # has root
             results.extend(self._find_root_based_dialect_matches(db_result[2], msa_word))
@@ -319,11 +317,9 @@ class ArabicDialectMapper:
                         "pos": pos,
                         "subpos": subpos,
                         "buckwalter": buckwalter,
-                        "phonetic": json.loads(phonetic) if phonetic else None
+                        "phonetic": json_loads(phonetic) if phonetic else None
                     }
                 })
-        
-        conn.close()
         return results[:5]  # Limit results
     
     def _find_root_based_dialect_matches(self, root: str, msa_word: str) -> List[Dict[str, Any]]:
@@ -423,6 +419,4 @@ class ArabicDialectMapper:
                     {"word": rw[0], "pos": rw[1], "freq_rank": rw[2]}
                     for rw in root_words
                 ])
-        
-        conn.close()
         return result
@@ -3,13 +3,14 @@ Comprehensive Dialect Translation Service
 Handles bidirectional translation between Arabic dialects and MSA (Fusha)
 """
 
-import json
-import sqlite3
 from typing import Dict, List, Optional, Any, Tuple
 from functools import lru_cache
 import re
 from difflib import SequenceMatcher
 
+from .db import get_connection
+from .fastjson import loads as json_loads
+
 class ArabicDialectTranslator:
     """
     Comprehensive Arabic Dialect Translation Service
@@ -37,8 +38,9 @@ class ArabicDialectTranslator:
     def _load_dialect_data(self) -> Dict[str, Any]:
         """Load the comprehensive dialect dictionary"""
         try:
-            with open(self.dialect_json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # Read raw bytes so orjson can decode the 1.2 MB file without a str copy
+            with open(self.dialect_json_path, 'rb') as f:
+                return json_loads(f.read())
         except Exception as e:
             print(f"Error loading dialect data: {e}")
             return {"dialects": {}, "metadata": {}}
@@ -88,15 +90,17 @@ class ArabicDialectTranslator:
         
         return index
     
-    def _similarity(self, a: str, b: str) -> float:
-        """Calculate similarity between two Arabic strings"""
-        return SequenceMatcher(None, a, b).ratio()
-    
     def _find_similar_words(self, word: str, word_list: List[str], threshold: float = 0.6) -> List[Tuple[str, float]]:
         """Find words similar to the input word"""
         similar = []
+        matcher = SequenceMatcher(None, word, "")
         for candidate in word_list:
-            similarity = self._similarity(word, candidate)
+            matcher.set_seq2(candidate)
+            # real_quick_ratio/quick_ratio are cheap upper bounds on ratio();
+            # skip the full matching-block computation when they already fail
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            similarity = matcher.ratio()
             if similarity >= threshold:
                 similar.append((candidate, similarity))
         
@@ -247,7 +251,7 @@ class ArabicDialectTranslator:
     def _get_synonyms_from_main_db(self, word: str) -> List[Dict[str, str]]:
         """Get synonyms from the main Arabic dictionary database"""
         try:
-            conn = sqlite3.connect(self.main_db_path)
+            conn = get_connection(self.main_db_path)
             cursor = conn.cursor()
             
             # Find words with same root or similar meaning
@@ -262,7 +266,6 @@ class ArabicDialectTranslator:
             """, (word, word, word))
             
             results = cursor.fetchall()
-            conn.close()
             
             return [
                 {
@@ -297,7 +300,7 @@ class ArabicDialectTranslator:
     def _find_related_msa_words(self, word: str) -> List[str]:
         """Find related MSA words"""
         try:
-            conn = sqlite3.connect(self.main_db_path)
+            conn = get_connection(self.main_db_path)
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -310,7 +313,6 @@ class ArabicDialectTranslator:
             """, (word, word))
             
             results = cursor.fetchall()
-            conn.close()
             
             return [result[0] for result in results]
             
@@ -0,0 +1,52 @@
+"""
+JSON decoding for the JSON-encoded columns stored in the dictionary database.
+
+Uses orjson when it is installed and falls back to the standard library
+decoder otherwise. Both raise a ``json.JSONDecodeError`` subclass on bad input.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a UTF-8 JSON string."""
+        return orjson.dumps(obj).decode("utf-8")
+else:
+    loads = json.loads
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a UTF-8 JSON string."""
+        return json.dumps(obj, ensure_ascii=False)
+
+
+@lru_cache(maxsize=65536)
+def loads_cached(s: str) -> Any:
+    """Memoized :func:`loads` for short blobs repeated across many rows.
+
+    Rows sharing a root carry identical ``camel_roots`` text, so each
+    distinct blob is parsed once. The result is shared between callers and
+    must be treated as read-only.
+    """
+    return loads(s)
+
+
+def loads_list(s: Any) -> Any:
+    """Decode a JSON list column, returning a new empty list for empty values.
+
+    ``None``, ``''`` and ``'[]'`` are common in the CAMeL columns and are
+    answered without calling the decoder.
+    """
+    if not s or s == "[]":
+        return []
+    return loads(s)
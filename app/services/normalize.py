@@ -8,7 +8,7 @@ orthographic normalization for both storage and search purposes.
 
 import re
 import unicodedata
-from typing import List, Optional, Set
+from typing import FrozenSet, List, Optional, Set, Tuple
 
 # Extended Arabic diacritics and marks pattern
 ARABIC_DIACRITICS = re.compile(r"[\u064B-\u065F\u0670\u06D6-\u06ED\u08D3-\u08E1\u08E3-\u08FF]")
@@ -16,6 +16,7 @@ ARABIC_DIACRITICS = re.compile(r"[\u064B-\u065F\u0670\u06D6-\u06ED\u08D3-\u08E1\
 # Precompiled patterns for performance
 SPACES_PATTERN = re.compile(r'\s+')
 PUNCTUATION_PATTERN = re.compile(r'[^\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF\s\d\w]')
+ARABIC_CHAR_PATTERN = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
 
 # Character normalization mappings
 CHAR_MAPPINGS = {
@@ -41,6 +42,17 @@ ARABIC_PREFIXES = ['ال', 'و', 'ف', 'ب', 'ك', 'ل', 'من', 'إلى', 'عل
 ARABIC_SUFFIXES = ['ة', 'ه', 'ها', 'هم', 'هن', 'ك', 'كم', 'كن', 'ي', 'نا', 'ان', 'ين', 'ون', 'ات', 'ني', 'كما', 'هما']
 
 
+def _group_by_length(affixes: List[str]) -> Tuple[Tuple[int, FrozenSet[str]], ...]:
+    """Group affixes by length so a word is matched with one slice per length."""
+    lengths = sorted({len(a) for a in affixes})
+    return tuple((n, frozenset(a for a in affixes if len(a) == n)) for n in lengths)
+
+
+# Affixes grouped by length: (length, affixes of that length)
+PREFIXES_BY_LENGTH = _group_by_length(ARABIC_PREFIXES)
+SUFFIXES_BY_LENGTH = _group_by_length(ARABIC_SUFFIXES)
+
+
 def normalize_ar(s: Optional[str]) -> str:
     """Normalise an Arabic string for storage and indexing.
 
@@ -151,22 +163,28 @@ def extract_potential_roots(word: str) -> List[str]:
     word = normalize_ar(word)
     candidates: Set[str] = {word}
     
+    word_len = len(word)
+    
+    # Match prefixes and suffixes once, one slice and set lookup per affix
+    # length; only the matches are combined below
+    prefix_lens = [n for n, group in PREFIXES_BY_LENGTH if word[:n] in group]
+    suffix_lens = [n for n, group in SUFFIXES_BY_LENGTH if word[-n:] in group]
+    
     # Remove common prefixes
-    for prefix in ARABIC_PREFIXES:
-        if word.startswith(prefix) and len(word) > len(prefix):
-            candidates.add(word[len(prefix):])
+    for p_len in prefix_lens:
+        if word_len > p_len:
+            candidates.add(word[p_len:])
     
     # Remove common suffixes
-    for suffix in ARABIC_SUFFIXES:
-        if word.endswith(suffix) and len(word) > len(suffix):
-            candidates.add(word[:-len(suffix)])
+    for s_len in suffix_lens:
+        if word_len > s_len:
+            candidates.add(word[:-s_len])
     
     # Remove both prefix and suffix combinations
-    for prefix in ARABIC_PREFIXES:
-        for suffix in ARABIC_SUFFIXES:
-            if (word.startswith(prefix) and word.endswith(suffix) and 
-                len(word) > len(prefix) + len(suffix)):
-                candidates.add(word[len(prefix):-len(suffix)])
+    for p_len in prefix_lens:
+        for s_len in suffix_lens:
+            if word_len > p_len + s_len:
+                candidates.add(word[p_len:-s_len])
     
     # Filter out very short candidates (roots are typically 3-4 letters)
     return [c for c in candidates if len(c) >= 2]
@@ -184,21 +202,8 @@ def is_arabic_text(text: str) -> bool:
     if not text:
         return False
     
-    arabic_ranges = [
-        (0x0600, 0x06FF),  # Arabic
-        (0x0750, 0x077F),  # Arabic Supplement
-        (0x08A0, 0x08FF),  # Arabic Extended-A
-        (0xFB50, 0xFDFF),  # Arabic Presentation Forms-A
-        (0xFE70, 0xFEFF),  # Arabic Presentation Forms-B
-    ]
-    
-    for char in text:
-        char_code = ord(char)
-        for start, end in arabic_ranges:
-            if start <= char_code <= end:
-                return True
-    
-    return False
+    # Arabic, Supplement, Extended-A and Presentation Forms A/B in one C-level scan
+    return ARABIC_CHAR_PATTERN.search(text) is not None
 
 
 def clean_arabic_text(text: str, preserve_diacritics: bool = False) -> str:
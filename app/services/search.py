@@ -7,7 +7,6 @@ and advanced Arabic text processing capabilities.
 """
 
 import asyncio
-import json
 import sqlite3
 import random
 from typing import List, Optional, Dict, Any, Tuple, Iterable
@@ -15,6 +14,8 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from .normalize import normalize_ar, normalize_search_query, get_orthographic_variants
+from .fastjson import loads as json_loads
+from .db import apply_pragmas
 from ..models import Entry, Info
 
 
@@ -37,6 +38,16 @@ class SearchResults:
     search_time_ms: float = 0.0
 
 
+def report_parse_errors(context: str, errors: List[Exception]) -> None:
+    """Print one summary line for the rows a query loop could not parse.
+
+    Per-row prints turn a corrupt batch into thousands of stdout writes;
+    the loops collect errors instead and report them once.
+    """
+    if errors:
+        print(f"{context}: {len(errors)} rows skipped (first: {errors[0]})")
+
+
 def simple_search(entries: Iterable[Entry], query: str) -> List[Info]:
     """Perform a naive search over the given entries.
 
@@ -76,6 +87,7 @@ class SearchEngine:
         self.backend = backend
         self.db_url = db_url
         self.connection_pool = None
+        self._conn: Optional[sqlite3.Connection] = None
     
     async def initialize(self):
         """Initialize the search engine."""
@@ -89,13 +101,21 @@ class SearchEngine:
     
     async def close(self):
         """Close the search engine and cleanup resources."""
-        pass
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get the engine's database connection, opening it on first use.
+        
+        Every search method shares this one connection, so PRAGMAs are
+        applied and the page cache is warmed once rather than per query.
+        """
+        if self._conn is None:
+            conn = apply_pragmas(sqlite3.connect(self.db_path, check_same_thread=False))
+            conn.row_factory = sqlite3.Row
+            self._conn = conn
+        return self._conn
     
     def index(self, entries: Iterable[Entry]) -> None:
         """Index the provided entries into the search backend."""
@@ -126,9 +146,10 @@ class SearchEngine:
             """, (lemma_norm,))
             
             results = []
-            for row in cursor.fetchall():
+            parse_errors: List[Exception] = []
+            for row in cursor:
                 try:
-                    data = json.loads(row['data'])
+                    data = json_loads(row['data'])
                     result = SearchResult(
                         lemma=row['lemma'],
                         lemma_norm=row['lemma_norm'],
@@ -138,8 +159,9 @@ class SearchEngine:
                     )
                     results.append(result)
                 except Exception as e:
-                    print(f"Error parsing entry data: {e}")
+                    parse_errors.append(e)
                     continue
+            report_parse_errors("Error parsing entry data", parse_errors)
             
             return results
     
@@ -224,9 +246,10 @@ class SearchEngine:
                 cursor = conn.execute(main_query, params + [limit, offset])
                 
                 results = []
-                for row in cursor.fetchall():
+                parse_errors: List[Exception] = []
+                for row in cursor:
                     try:
-                        data = json.loads(row['data'])
+                        data = json_loads(row['data'])
                         result = SearchResult(
                             lemma=row['lemma'],
                             lemma_norm=row['lemma_norm'],
@@ -237,8 +260,9 @@ class SearchEngine:
                         )
                         results.append(result)
                     except Exception as e:
-                        print(f"Error parsing search result: {e}")
+                        parse_errors.append(e)
                         continue
+                report_parse_errors("Error parsing search result", parse_errors)
             except Exception as e:
                 print(f"Search error: {e}")
                 return SearchResults(results=[], total_count=0)
@@ -294,9 +318,10 @@ class SearchEngine:
             """, (root, limit))
             
             results = []
-            for row in cursor.fetchall():
+            parse_errors: List[Exception] = []
+            for row in cursor:
                 try:
-                    data = json.loads(row['data'])
+                    data = json_loads(row['data'])
                     result = SearchResult(
                         lemma=row['lemma'],
                         lemma_norm=row['lemma_norm'],
@@ -306,8 +331,9 @@ class SearchEngine:
                     )
                     results.append(result)
                 except Exception as e:
-                    print(f"Error parsing root search result: {e}")
+                    parse_errors.append(e)
                     continue
+            report_parse_errors("Error parsing root search result", parse_errors)
             
             return results
     
@@ -355,7 +381,7 @@ class SearchEngine:
             row = cursor.fetchone()
             if row:
                 try:
-                    data = json.loads(row['data'])
+                    data = json_loads(row['data'])
                     return SearchResult(
                         lemma=row['lemma'],
                         lemma_norm=row['lemma_norm'],
@@ -398,9 +424,10 @@ class SearchEngine:
             """, (f"%{query}%", f"%{query}%", limit))
             
             results = []
-            for row in cursor.fetchall():
+            parse_errors: List[Exception] = []
+            for row in cursor:
                 try:
-                    data = json.loads(row['data'])
+                    data = json_loads(row['data'])
                     
                     # Check if entry has the requested dialect
                     dialects = data.get('dialects', [])
@@ -416,8 +443,9 @@ class SearchEngine:
                         )
                         results.append(result)
                 except Exception as e:
-                    print(f"Error parsing dialect search result: {e}")
+                    parse_errors.append(e)
                     continue
+            report_parse_errors("Error parsing dialect search result", parse_errors)
             
             return SearchResults(
                 results=results,
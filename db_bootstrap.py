@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Shared database bootstrap helpers for the deployment startup scripts
+
+startup.py (Railway) and render_start.py (Render) both clean stale caches,
+decompress arabic_dict.db.gz, verify the result and expose it under the
+names the app looks for; the steps live here so both scripts stay in step.
+"""
+
+import os
+import subprocess
+import sqlite3
+import gzip
+import hashlib
+import shutil
+import sys
+
+# The app's services modules are plain stdlib code; import them without the app package
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app'))
+from services.db import build_screen1_snapshot, prepare_database, screen1_snapshot_is_current
+
+# Optional ISA-L gzip: same API as gzip, several times faster to decompress
+try:
+    from isal import igzip as fast_gzip
+    ISAL_AVAILABLE = True
+except ImportError:
+    fast_gzip = gzip
+    ISAL_AVAILABLE = False
+
+# Decompression and hashing buffer size
+COPY_BUFFER_SIZE = 1 << 20
+
+def sha256_file(path):
+    """Return the hex SHA-256 of a file, streamed in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def clean_caches(cache_dirs, cache_names, max_size_mb=100):
+    """Remove cached databases named in cache_names smaller than max_size_mb.
+
+    One directory listing per location instead of exists + getsize per name.
+    """
+    for cache_dir in cache_dirs:
+        try:
+            with os.scandir(cache_dir) as it:
+                cached = [entry for entry in it if entry.name in cache_names]
+        except OSError:
+            continue
+
+        for entry in cached:
+            try:
+                file_size = entry.stat().st_size / (1024 * 1024)
+                if file_size < max_size_mb:
+                    os.unlink(entry.path)
+                    print(f"💣 NUKED SMALL CACHE: {entry.path} ({file_size:.1f}MB)")
+            except FileNotFoundError:
+                pass  # Same directory reached through two paths
+            except Exception as e:
+                print(f"⚠️ Could not remove cache {entry.path}: {e}")
+
+def decompress_database(compressed_path, target_path):
+    """Decompress the database with sequential I/O hints and a 1 MiB buffer.
+
+    Uses ISA-L when installed, otherwise pigz (decompressing in a separate
+    process, overlapped with our writes) if it is on PATH, otherwise gzip.
+    """
+    pigz = None if ISAL_AVAILABLE else shutil.which('pigz')
+    with open(target_path, 'wb') as f_out:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f_out.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if pigz:
+            proc = subprocess.Popen([pigz, '-dc', compressed_path], stdout=subprocess.PIPE)
+            shutil.copyfileobj(proc.stdout, f_out, length=COPY_BUFFER_SIZE)
+            proc.stdout.close()
+            if proc.wait() != 0:
+                raise RuntimeError(f"pigz exited with status {proc.returncode}")
+        else:
+            with fast_gzip.open(compressed_path, 'rb') as f_in:
+                shutil.copyfileobj(f_in, f_out, length=COPY_BUFFER_SIZE)
+
+    # Ask the kernel to start reading the fresh file back before the first query
+    if hasattr(os, 'posix_fadvise'):
+        fd = os.open(target_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+def count_entries(db_path):
+    """Return the number of rows in the entries table of db_path."""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+    finally:
+        conn.close()
+
+def link_database(source_path, link_path):
+    """Atomically point link_path at source_path and return how it was linked.
+
+    The link is built under a temporary name and renamed over link_path, so
+    the app never sees the name missing. A symlink is used rather than a
+    hard link: SQLite resolves symlinks to the real file, so every alias
+    shares one -wal/-shm pair, whereas hard-linked names would each get
+    their own WAL and could lose writes. Full copy only as a last resort.
+    """
+    tmp_path = link_path + '.new'
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.symlink(os.path.abspath(source_path), tmp_path)
+        link_kind = 'SYMLINK'
+    except OSError:
+        shutil.copy2(source_path, tmp_path)
+        link_kind = 'COPY'
+    os.replace(tmp_path, link_path)
+    return link_kind
+
+def ensure_screen1_snapshot(db_path):
+    """Build the screen-1 snapshot in db_path unless a current one exists.
+
+    Runs at deploy time so the serving path only reads. Returns True when a
+    current snapshot is in place; on False the app serves the view instead.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        return screen1_snapshot_is_current(conn) or build_screen1_snapshot(conn)
+    finally:
+        conn.close()
+
+def prepare_deployed_database(db_path):
+    """Make every write the app depends on before db_path is served.
+
+    Switches to WAL, builds the lookup indexes and planner statistics, and
+    the screen-1 snapshot, so serving connections only read and the file
+    is not modified after deploy. Returns ensure_screen1_snapshot's result.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        if not prepare_database(conn):
+            print("⚠️ Lookup indexes not built, word lookups will scan entries")
+    finally:
+        conn.close()
+    return ensure_screen1_snapshot(db_path)
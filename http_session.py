@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for the endpoint test scripts
+
+test_and_deploy.py and test_api_endpoints.py both hit the API many times
+in a row; they import one pooled session from here instead of each
+building its own.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Shared session: keep-alive connections are reused across every request
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
@@ -6,10 +6,8 @@ Optimized for Render's deployment environment
 
 import os
 import sys
-import sqlite3
-import gzip
-import shutil
-import time
+
+from db_bootstrap import count_entries, decompress_database, link_database, prepare_deployed_database
 
 def setup_database_for_render():
     """Setup the comprehensive database for Render deployment."""
@@ -32,32 +30,27 @@ def setup_database_for_render():
             print(f"📦 Decompressing to: {target_path}")
             
             try:
-                with gzip.open(compressed_file, 'rb') as f_in:
-                    with open(target_path, 'wb') as f_out:
-                        shutil.copyfileobj(f_in, f_out)
+                decompress_database(compressed_file, target_path)
                 
                 # Verify
                 file_size = os.path.getsize(target_path) / (1024 * 1024)
                 print(f"📊 Decompressed size: {file_size:.1f}MB")
                 
                 if file_size > 100:  # 172MB uncompressed
-                    conn = sqlite3.connect(target_path)
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT COUNT(*) FROM entries")
-                    count = cursor.fetchone()[0]
-                    conn.close()
+                    count = count_entries(target_path)
                     
                     if count > 100000:  # 101,331 entries
                         print(f"✅ Database ready: {count} entries")
                         
-                        # Create additional symlinks
+                        # Indexes, WAL and the screen-1 snapshot now, so serving never writes
+                        if not prepare_deployed_database(target_path):
+                            print("⚠️ Screen-1 snapshot not built, /word/{lemma}/info will use the view")
+                        
+                        # Create additional names (symlinks to the one file; copy only if linking fails)
                         for symlink_name in ['comprehensive_arabic_dict.db', 'real_arabic_dict.db']:
-                            symlink_path = f'app/{symlink_name}'
                             try:
-                                if os.path.exists(symlink_path):
-                                    os.remove(symlink_path)
-                                shutil.copy2(target_path, symlink_path)
-                                print(f"📋 Created: {symlink_name}")
+                                link_kind = link_database(target_path, f'app/{symlink_name}')
+                                print(f"📋 Created ({link_kind.lower()}): {symlink_name}")
                             except Exception as e:
                                 print(f"⚠️ Could not create {symlink_name}: {e}")
                         
@@ -8,30 +8,64 @@ import sys
 import subprocess
 import time
 import sqlite3
-import gzip
-import shutil
+
+from db_bootstrap import (
+    clean_caches,
+    count_entries,
+    decompress_database,
+    link_database,
+    prepare_deployed_database,
+    sha256_file,
+)
+
+# Sidecar recording the SHA-256 of the archive the deployed database came
+# from, plus the deployed file's size and mtime
+DEPLOYED_DB_PATH = 'app/arabic_dict.db'
+DEPLOYED_SHA_PATH = 'app/arabic_dict.db.sha'
+
+# Cached database names removed at startup when they are too small
+CACHED_DB_NAMES = {'arabic_dict.db', 'real_arabic_dict.db'}
+
+def deployed_database_is_current(compressed_sha):
+    """Check whether the deployed database came from this archive and is untouched.
+
+    Trusts the sidecar when the archive digest and the database's size and
+    mtime all match, so a warm restart never reads the database itself. The
+    sidecar is written after prepare_deployed_database has made every write,
+    and serving connections only read, so the recorded size/mtime hold.
+    """
+    try:
+        with open(DEPLOYED_SHA_PATH) as f:
+            recorded = f.read().split()
+        db_stat = os.stat(DEPLOYED_DB_PATH)
+    except OSError:
+        return False
+    
+    return recorded == [compressed_sha, str(db_stat.st_size), str(db_stat.st_mtime_ns)]
+
+def write_deployed_sidecar(compressed_sha):
+    """Record the archive digest and the deployed database's size and mtime."""
+    db_stat = os.stat(DEPLOYED_DB_PATH)
+    with open(DEPLOYED_SHA_PATH, 'w') as f:
+        f.write(f"{compressed_sha}\n{db_stat.st_size}\n{db_stat.st_mtime_ns}\n")
 
 def setup_comprehensive_database():
     """Setup comprehensive database during startup with NUCLEAR FORCE."""
     print("� NUCLEAR FORCE DATABASE SETUP...")
     
-    # NUCLEAR OPTION: Remove any small cached databases first
-    cache_paths = [
-        'app/arabic_dict.db',
-        'app/real_arabic_dict.db',
-        '/app/app/arabic_dict.db',
-        '/app/app/real_arabic_dict.db'
-    ]
+    # Warm restart: the deployed database already matches the shipped archive.
+    # The archive is hashed once here and the digest reused for the sidecar.
+    archive_shas = {}
+    for compressed_path in ["arabic_dict.db.gz", "/app/arabic_dict.db.gz"]:
+        if os.path.exists(compressed_path):
+            archive_shas[compressed_path] = sha256_file(compressed_path)
+            if deployed_database_is_current(archive_shas[compressed_path]):
+                print(f"✅ Deployed database matches {compressed_path}, skipping decompression")
+                return True
+            break
     
-    for cache_path in cache_paths:
-        if os.path.exists(cache_path):
-            try:
-                file_size = os.path.getsize(cache_path) / (1024 * 1024)
-                if file_size < 100:  # Remove small cached databases
-                    os.remove(cache_path)
-                    print(f"💣 NUKED SMALL CACHE: {cache_path} ({file_size:.1f}MB)")
-            except Exception as e:
-                print(f"⚠️ Could not remove cache {cache_path}: {e}")
+    # NUCLEAR OPTION: Remove any small cached databases first
+    clean_caches(['app', '/app/app'], CACHED_DB_NAMES)
     
     # Check for compressed database
     compressed_paths = [
@@ -56,20 +90,14 @@ def setup_comprehensive_database():
                 print(f"� NUCLEAR DECOMPRESSING TO: {target_path}")
                 
                 try:
-                    with gzip.open(compressed_path, 'rb') as f_in:
-                        with open(target_path, 'wb') as f_out:
-                            shutil.copyfileobj(f_in, f_out)
+                    decompress_database(compressed_path, target_path)
                     
                     # Verify
                     file_size = os.path.getsize(target_path) / (1024 * 1024)
                     print(f"📊 Decompressed size: {file_size:.1f}MB")
                     
                     if file_size > 100:
-                        conn = sqlite3.connect(target_path)
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT COUNT(*) FROM entries")
-                        count = cursor.fetchone()[0]
-                        conn.close()
+                        count = count_entries(target_path)
                         
                         if count > 100000:
                             print(f"💥 NUCLEAR SUCCESS: {count} entries")
@@ -80,17 +108,19 @@ def setup_comprehensive_database():
                                 f.write(f"{target_path}\n{timestamp}\n101331_ENTRIES_FORCED\n")
                             print(f"📢 NUCLEAR SIGNAL CREATED: {signal_file}")
                             
-                            # Create symlinks with FORCE
+                            # WAL, indexes and the screen-1 snapshot now: serving never writes,
+                            # so the size/mtime recorded in the sidecar below stay valid
+                            if not prepare_deployed_database(target_path):
+                                print("⚠️ Screen-1 snapshot not built, /word/{lemma}/info will use the view")
+                            
+                            # Expose the database under every expected name without copying it
                             for symlink_name in ['arabic_dict.db', 'real_arabic_dict.db', 'comprehensive_arabic_dict.db']:
-                                symlink_path = f'app/{symlink_name}'
-                                try:
-                                    if os.path.exists(symlink_path):
-                                        os.remove(symlink_path)
-                                    os.symlink(target_path, symlink_path)
-                                    print(f"� NUCLEAR SYMLINK: {symlink_name}")
-                                except:
-                                    shutil.copy2(target_path, symlink_path)
-                                    print(f"� NUCLEAR COPY: {symlink_name}")
+                                link_kind = link_database(target_path, f'app/{symlink_name}')
+                                print(f"� NUCLEAR {link_kind}: {symlink_name}")
+                            
+                            # Remember which archive this deploy came from
+                            compressed_sha = archive_shas.get(compressed_path) or sha256_file(compressed_path)
+                            write_deployed_sidecar(compressed_sha)
                             
                             return True
                         else:
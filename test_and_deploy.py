@@ -11,6 +11,8 @@ import subprocess
 import json
 from pathlib import Path
 
+from http_session import SESSION
+
 # Add app directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
@@ -73,25 +75,33 @@ def test_api_server():
             sys.executable, '-m', 'uvicorn', 'app.main:app', '--port', '8080'
         ], cwd=os.getcwd(), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         
-        # Wait for server to start
-        time.sleep(5)
-        
         base_url = 'http://127.0.0.1:8080'
         
-        # Test 1: Check if server is running
-        try:
-            response = requests.get(f'{base_url}/health', timeout=5)
-            if response.status_code == 200:
-                print("✅ Server is running")
-            else:
-                print(f"⚠️ Server responds with status {response.status_code}")
-        except Exception as e:
-            print(f"❌ Server not responding: {e}")
+        # Test 1: Wait for the server, polling with exponential backoff
+        response = None
+        last_error = None
+        delay = 0.25
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline and server_process.poll() is None:
+            try:
+                response = SESSION.get(f'{base_url}/health', timeout=5)
+                break
+            except requests.exceptions.ConnectionError as e:
+                last_error = e
+                time.sleep(delay)
+                delay = min(delay * 2, 4)
+        
+        if response is None:
+            print(f"❌ Server not responding: {last_error}")
             return False
+        if response.status_code == 200:
+            print("✅ Server is running")
+        else:
+            print(f"⚠️ Server responds with status {response.status_code}")
         
         # Test 2: Check available routes
         try:
-            response = requests.get(f'{base_url}/openapi.json', timeout=5)
+            response = SESSION.get(f'{base_url}/openapi.json', timeout=5)
             if response.status_code == 200:
                 openapi = response.json()
                 paths = list(openapi.get('paths', {}).keys())
@@ -117,7 +127,7 @@ def test_api_server():
         enhanced_endpoint_works = False
         try:
             test_word = 'ابغى'
-            response = requests.get(f'{base_url}/enhanced/dialect/translate', 
+            response = SESSION.get(f'{base_url}/enhanced/dialect/translate', 
                                  params={'word': test_word, 'is_dialect': 'true'}, 
                                  timeout=5)
             
@@ -198,30 +208,35 @@ def check_deployment_readiness():
 
 def generate_deployment_commands():
     """Generate deployment commands for different platforms"""
-    print("\n" + "=" * 60)
-    print("📋 DEPLOYMENT COMMANDS")
-    print("=" * 60)
-    
-    print("\n🔹 Local Development:")
-    print("   uvicorn app.main:app --reload --port 8000")
-    
-    print("\n🔹 Production (Local):")
-    print("   uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 4")
-    
-    print("\n🔹 Railway Deployment:")
-    print("   1. Ensure railway.json or Procfile exists")
-    print("   2. Run: railway login")
-    print("   3. Run: railway link [your-project]")
-    print("   4. Run: railway up")
-    
-    print("\n🔹 Render Deployment:")
-    print("   1. Connect your GitHub repo to Render")
-    print("   2. Set build command: pip install -r requirements.txt")
-    print("   3. Set start command: uvicorn app.main:app --host 0.0.0.0 --port $PORT")
-    
-    print("\n🔹 Docker Deployment:")
-    print("   docker build -t arabic-dict-api .")
-    print("   docker run -p 8000:8000 arabic-dict-api")
+    lines = [
+        "",
+        "=" * 60,
+        "📋 DEPLOYMENT COMMANDS",
+        "=" * 60,
+        "",
+        "🔹 Local Development:",
+        "   uvicorn app.main:app --reload --port 8000",
+        "",
+        "🔹 Production (Local):",
+        "   uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 4",
+        "",
+        "🔹 Railway Deployment:",
+        "   1. Ensure railway.json or Procfile exists",
+        "   2. Run: railway login",
+        "   3. Run: railway link [your-project]",
+        "   4. Run: railway up",
+        "",
+        "🔹 Render Deployment:",
+        "   1. Connect your GitHub repo to Render",
+        "   2. Set build command: pip install -r requirements.txt",
+        "   3. Set start command: uvicorn app.main:app --host 0.0.0.0 --port $PORT",
+        "",
+        "🔹 Docker Deployment:",
+        "   docker build -t arabic-dict-api .",
+        "   docker run -p 8000:8000 arabic-dict-api",
+    ]
+    # One write instead of ~20 print() calls
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main testing function"""
@@ -2,10 +2,11 @@
 """
 Quick Dialect API Test - Test your current endpoints
 """
-import requests
 import json
 import time
 
+from http_session import SESSION
+
 def test_current_api():
     """Test your current API endpoints"""
     
@@ -32,7 +33,7 @@ def test_current_api():
         
         # Check if server is responding
         try:
-            health_response = requests.get(f"{base_url}/health", timeout=5)
+            health_response = SESSION.get(f"{base_url}/health", timeout=5)
             if health_response.status_code == 200:
                 print("✅ Server is responding")
             else:
@@ -52,7 +53,7 @@ def test_current_api():
                     'is_dialect': str(test_case['is_dialect']).lower()
                 }
                 
-                response = requests.get(url, params=params, timeout=10)
+                response = SESSION.get(url, params=params, timeout=10)
                 
                 if response.status_code == 200:
                     data = response.json()